@@ -1,20 +1,55 @@
-from datetime import date, datetime, timedelta, timezone
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from itertools import chain
+import os
+import threading
 import uuid as uuidlib
 
-from typing import Optional
-
-from sqlalchemy import func
-from sqlalchemy.orm import Session
-
-from models import Category, LogEntry, Project, TimeSpan, Timer, TimerStatus
+from typing import Any, Optional
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Select,
+    case,
+    cast,
+    column,
+    event,
+    func,
+    insert,
+    inspect,
+    lambda_stmt,
+    select,
+    table,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import ORMExecuteState, Query, Session, defer, raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from db import project_fts_enabled
+from models import (
+    Category,
+    LogEntry,
+    Project,
+    TIMER_SINGLETON_ID,
+    TimeSpan,
+    Timer,
+    TimerStatus,
+    span_duration_seconds,
+    utc_now,
+)
 from time_merge import SpanLike, plan_connectable_timespan_merges
 from schemas import (
+    ActiveTimerRead,
     DailyReport,
     LogEntryCreate,
     LogEntryUpdate,
     ProjectCreate,
     ReportEntry,
     ReportTotals,
+    TimeSpanBatchItem,
+    TimeSpanRead,
     TimeSpanUpdate,
     TimerStartRequest,
     WeeklyCategories,
@@ -24,6 +59,32 @@ from schemas import (
 
 
 QUARTER_HOUR_MINUTES = 15
+_QUARTER_HOUR_MICROS = QUARTER_HOUR_MINUTES * 60 * 1_000_000
+
+# Debug/test aid: when enabled, read helpers refuse any relationship load that
+# was not requested explicitly, so accidental N+1 lazy loads fail loudly.
+STRICT_ORM_LOADING = os.getenv("STRICT_ORM_LOADING", "").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "y",
+    "on",
+}
+
+
+def _loader_options(*options: LoaderOption) -> list[LoaderOption]:
+    """Return the explicit loader options, plus raiseload("*") in strict mode."""
+    if STRICT_ORM_LOADING:
+        return [*options, raiseload("*")]
+    return list(options)
+
+
+def _with_strict_loading(query: Query, *options: LoaderOption) -> Query:
+    """Apply explicit loader options, plus raiseload("*") in strict mode."""
+    loader_options = _loader_options(*options)
+    if loader_options:
+        query = query.options(*loader_options)
+    return query
 
 
 def round_to_quarter_hour(dt: datetime) -> datetime:
@@ -32,16 +93,30 @@ def round_to_quarter_hour(dt: datetime) -> datetime:
     Notes:
     - Works for naive UTC datetimes (as stored in the DB).
     - Includes seconds/microseconds in rounding.
+    - Exact ties round half to even (same as the built-in round()).
     - Handles day rollover (e.g., 23:59:50 rounding up to next day 00:00).
+    - Uses integer microseconds since midnight (no float math, no local-time
+      conversion via dt.timestamp()).
     """
-    total_minutes = (
-        dt.hour * 60 + dt.minute + dt.second / 60.0 + dt.microsecond / 60_000_000.0
-    )
-    rounded_minutes = int(
-        round(total_minutes / QUARTER_HOUR_MINUTES) * QUARTER_HOUR_MINUTES
+    if dt.minute % QUARTER_HOUR_MINUTES == 0 and not dt.second and not dt.microsecond:
+        # Already on a boundary (e.g. timer timestamps, re-normalized spans).
+        return dt
+    micros = (
+        (dt.hour * 3600 + dt.minute * 60 + dt.second) * 1_000_000 + dt.microsecond
     )
+    quarters, remainder = divmod(micros, _QUARTER_HOUR_MICROS)
+    twice_remainder = remainder * 2
+    if twice_remainder > _QUARTER_HOUR_MICROS or (
+        twice_remainder == _QUARTER_HOUR_MICROS and quarters % 2
+    ):
+        quarters += 1
     midnight = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-    return midnight + timedelta(minutes=rounded_minutes)
+    return midnight + timedelta(minutes=quarters * QUARTER_HOUR_MINUTES)
+
+
+def quantize_hours(hours: float) -> float:
+    """Round an hour amount to the nearest 0.25h (ties round half to even)."""
+    return round(hours * 4) * 0.25
 
 
 def normalize_span(
@@ -53,33 +128,45 @@ def normalize_span(
         return new_start, None
 
     new_end = round_to_quarter_hour(end_timestamp)
+    # Both ends are on quarter-hour boundaries, so any positive span is >= 15m.
     if new_end <= new_start:
         new_end = new_start + timedelta(minutes=QUARTER_HOUR_MINUTES)
 
-    duration = (new_end - new_start).total_seconds() / 3600.0
-    if duration < 0.25:
-        new_end = new_start + timedelta(minutes=QUARTER_HOUR_MINUTES)
-
     return new_start, new_end
 
 
+def _resolve_now(now: datetime | None) -> datetime:
+    """Return the caller's request-time snapshot, or the current naive UTC time.
+
+    Public CRUD functions take an optional `now` and pass the resolved value to
+    the helpers they call, so one request agrees on a single timestamp.
+    """
+    if now is not None:
+        return now
+    return utc_now()
+
+
 def maybe_close_open_timespan(
     db: Session,
     *,
     incoming_start: datetime,
     incoming_end: datetime | None,
     exclude_timespan_id: int | None = None,
+    now: datetime | None = None,
 ) -> None:
-    """Close a running span if a manual change would overlap or be in the future."""
+    """Close a running span if a manual change would overlap or be in the future.
+
+    Runs inside the caller's transaction; the caller commits.
+    """
     active = get_active_timespan(db)
     if not active:
         return
     if exclude_timespan_id is not None and active.id == exclude_timespan_id:
         return
 
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    now = _resolve_now(now)
     if incoming_start > now:
-        end_timespan(db, active.id)
+        _close_timespan(db, active, now)
         return
 
     open_start = active.start_timestamp
@@ -87,7 +174,7 @@ def maybe_close_open_timespan(
     candidate_end = incoming_end or now
     overlaps = incoming_start <= open_end and candidate_end >= open_start
     if overlaps:
-        end_timespan(db, active.id)
+        _close_timespan(db, active, now)
 
 
 def merge_connectable_timespans_for_entry(
@@ -95,6 +182,7 @@ def merge_connectable_timespans_for_entry(
     log_entry_id: int,
     gap_minutes: int = QUARTER_HOUR_MINUTES,
     prefer_timespan_id: int | None = None,
+    now: datetime | None = None,
 ) -> None:
     """Merge connectable TimeSpans for an entry so they never overlap.
 
@@ -105,33 +193,46 @@ def merge_connectable_timespans_for_entry(
 
     Open/running spans (end_timestamp is NULL) are treated as end=now for
     connectability checks so they do not absorb future spans.
+
+    Planning reads the stored rows, so callers flush pending span changes first.
+    Runs inside the caller's transaction (flushes, never commits).
     """
-    spans = (
-        db.query(TimeSpan)
-        .filter(TimeSpan.log_entry_id == log_entry_id)
-        .order_by(TimeSpan.start_timestamp.asc(), TimeSpan.id.asc())
-        .all()
-    )
-    if len(spans) <= 1:
+    # Plan from plain column rows; ORM objects are only loaded for the spans a
+    # plan actually touches (most calls find nothing to merge).
+    rows = db.execute(
+        lambda_stmt(
+            lambda: select(TimeSpan.id, TimeSpan.start_timestamp, TimeSpan.end_timestamp)
+            .where(TimeSpan.log_entry_id == log_entry_id)
+            .order_by(TimeSpan.start_timestamp.asc(), TimeSpan.id.asc())
+        )
+    ).all()
+    if len(rows) <= 1:
         return
 
-    span_likes = [
-        SpanLike(
-            id=s.id, start_timestamp=s.start_timestamp, end_timestamp=s.end_timestamp
-        )
-        for s in spans
-    ]
-    reference_now = datetime.now(timezone.utc).replace(tzinfo=None)
+    span_likes = [SpanLike._make(row) for row in rows]
+    reference_now = _resolve_now(now)
     plans = plan_connectable_timespan_merges(
         span_likes,
         gap_minutes=gap_minutes,
         prefer_timespan_id=prefer_timespan_id,
         reference_now=reference_now,
+        # Rows come back in the planner's (start_timestamp, id) order.
+        assume_sorted=True,
     )
     if not plans:
         return
 
-    by_id: dict[int, TimeSpan] = {s.id: s for s in spans}
+    touched_ids = [
+        span_id for plan in plans for span_id in (plan.keeper_id, *plan.delete_ids)
+    ]
+    by_id: dict[int, TimeSpan] = {
+        s.id: s
+        for s in db.scalars(
+            select(TimeSpan)
+            .where(TimeSpan.id.in_(touched_ids))
+            .options(*_loader_options())
+        )
+    }
     for plan in plans:
         keeper = by_id.get(plan.keeper_id)
         if keeper is None:
@@ -144,43 +245,45 @@ def merge_connectable_timespans_for_entry(
             if span is not None:
                 db.delete(span)
 
-    db.commit()
+    db.flush()
+    recalculate_entry_hours(db, log_entry_id)
 
-    entry = get_log(db, log_entry_id)
-    if entry:
-        entry.hours = calculate_total_hours(db, entry.id, entry.additional_hours)
-        db.commit()
 
+# Loader options for the lambda_stmt list reads, resolved once at import
+# (functions can't be called inside a lambda_stmt).
+_LOG_READ_OPTS: tuple[LoaderOption, ...] = tuple(_loader_options())
 
-def get_logs_by_date(db: Session, target_date: date):
-    from sqlalchemy.orm import joinedload
 
-    return (
-        db.query(LogEntry)
-        .options(joinedload(LogEntry.project_rel))
-        .filter(LogEntry.date == target_date)
+def get_logs_by_date(db: Session, target_date: date):
+    # target_date is picked up from the closure as a bound parameter.
+    stmt = lambda_stmt(
+        lambda: select(LogEntry)
+        .options(*_LOG_READ_OPTS)
+        .where(LogEntry.date == target_date)
         .order_by(LogEntry.id.asc())
-        .all()
     )
+    return db.scalars(stmt).all()
 
 
 def get_log(db: Session, log_id: int):
-    from sqlalchemy.orm import joinedload
+    # Session.get() returns the identity-map instance without SQL when loaded.
+    return db.get(LogEntry, log_id, options=_loader_options())
 
-    return (
-        db.query(LogEntry)
-        .options(joinedload(LogEntry.project_rel))
-        .filter(LogEntry.id == log_id)
-        .first()
+
+def _get_entry_lite(db: Session, log_id: int) -> LogEntry | None:
+    """Fetch a LogEntry for a write path without its project name subquery.
+
+    For callers that only check existence or touch the entry's own columns;
+    project_name still loads on access if something reads it.
+    """
+    return db.get(
+        LogEntry, log_id, options=_loader_options(defer(LogEntry.project_name))
     )
 
 
 def get_log_by_uuid(db: Session, log_uuid: str):
-    from sqlalchemy.orm import joinedload
-
     return (
-        db.query(LogEntry)
-        .options(joinedload(LogEntry.project_rel))
+        _with_strict_loading(db.query(LogEntry))
         .filter(LogEntry.uuid == log_uuid)
         .first()
     )
@@ -188,38 +291,65 @@ def get_log_by_uuid(db: Session, log_uuid: str):
 
 def create_log(db: Session, log: LogEntryCreate):
     log_dict = log.model_dump()
-    additional_hours = log_dict.pop("additional_hours", 0.0)
-    # Remove hours since we'll recalculate it
+    additional_hours = quantize_hours(log_dict.pop("additional_hours", 0.0))
+    # Client-sent hours are ignored; they are derived from spans + additional.
     log_dict.pop("hours", None)
     # Ensure server-side UUID exists even if DB didn't apply default (or client omitted).
     log_dict.setdefault("uuid", str(uuidlib.uuid4()))
 
-    # Set initial hours to 0, will be recalculated
-    entry = LogEntry(
-        **log_dict, additional_hours=round(additional_hours * 4) / 4.0, hours=0.0
-    )
+    # A new entry has no TimeSpans yet, so its total is just the (already
+    # quarter-hour) additional hours; no recalculation UPDATE is needed.
+    entry = LogEntry(**log_dict, additional_hours=additional_hours, hours=additional_hours)
     db.add(entry)
     db.commit()
+    # The refresh loads project_name (a column_property the INSERT can't
+    # return) in one SELECT.
     db.refresh(entry)
+    return entry
 
-    # Calculate total hours = TimeSpan hours + additional hours
-    entry.hours = calculate_total_hours(db, entry.id, entry.additional_hours)
 
-    db.commit()
-    db.refresh(entry)
-    # Eager load project relationship
-    from sqlalchemy.orm import joinedload
+def create_logs_batch(db: Session, logs: list[LogEntryCreate]) -> list[LogEntry]:
+    """Create many LogEntries with a single multi-row INSERT.
 
-    entry = (
-        db.query(LogEntry)
-        .options(joinedload(LogEntry.project_rel))
-        .filter(LogEntry.id == entry.id)
-        .first()
+    New entries have no TimeSpans, so hours is just the rounded additional
+    hours and needs no per-row recalculation. The created entries are then
+    reloaded in one query (projects selectin-loaded) in request order.
+    """
+    if not logs:
+        return []
+
+    rows: list[dict] = []
+    for log in logs:
+        log_dict = log.model_dump()
+        additional_hours = quantize_hours(log_dict.pop("additional_hours", 0.0))
+        log_dict.pop("hours", None)
+        log_dict.setdefault("uuid", str(uuidlib.uuid4()))
+        rows.append(
+            {**log_dict, "additional_hours": additional_hours, "hours": additional_hours}
+        )
+
+    # RETURNING rows only follow the parameter order when asked to.
+    ids = list(
+        db.scalars(
+            insert(LogEntry).returning(LogEntry.id, sort_by_parameter_order=True), rows
+        )
     )
-    return entry
+    # Bulk INSERT bypasses the unit of work, so the flush hook never sees it.
+    _mark_stats_dirty(db)
+    db.commit()
+
+    by_id = {
+        entry.id: entry
+        for entry in _with_strict_loading(db.query(LogEntry)).filter(
+            LogEntry.id.in_(ids)
+        )
+    }
+    return [by_id[entry_id] for entry_id in ids]
 
 
 def update_log(db: Session, log_id: int, log: LogEntryUpdate):
+    # Not _get_entry_lite(): refresh() reuses the options the instance was
+    # loaded with, and the response needs project_name.
     entry = get_log(db, log_id)
     if not entry:
         return None
@@ -236,27 +366,21 @@ def update_log(db: Session, log_id: int, log: LogEntryUpdate):
             setattr(entry, field, value)
 
     # Update additional_hours
-    entry.additional_hours = round(additional_hours * 4) / 4.0
+    entry.additional_hours = quantize_hours(additional_hours)
+
+    db.flush()
 
     # Calculate total hours = TimeSpan hours + additional hours
-    entry.hours = calculate_total_hours(db, entry.id, entry.additional_hours)
+    recalculate_entry_hours(db, entry.id)
 
     db.commit()
+    # The refresh reloads project_name (project_id may have changed).
     db.refresh(entry)
-    # Eager load project relationship
-    from sqlalchemy.orm import joinedload
-
-    entry = (
-        db.query(LogEntry)
-        .options(joinedload(LogEntry.project_rel))
-        .filter(LogEntry.id == entry.id)
-        .first()
-    )
     return entry
 
 
 def delete_log(db: Session, log_id: int):
-    entry = get_log(db, log_id)
+    entry = _get_entry_lite(db, log_id)
     if not entry:
         return None
     db.delete(entry)
@@ -264,55 +388,155 @@ def delete_log(db: Session, log_id: int):
     return entry
 
 
-def get_stats(db: Session, start_date: date, end_date: date):
-    rows = (
-        db.query(
-            LogEntry.date.label("date"),
-            LogEntry.category.label("category"),
-            func.sum(LogEntry.hours).label("hours"),
-        )
-        .filter(LogEntry.date >= start_date, LogEntry.date <= end_date)
-        .group_by(LogEntry.date, LogEntry.category)
-        .all()
-    )
+# get_stats() and daily report caches. Entries are tagged with the stats
+# version they were computed under; any committed LogEntry write bumps the
+# version, so stale entries are simply never returned.
+#
+# All in-process caches here (these two and the active timer/timespan
+# snapshots further down) follow the same rule: they are versioned by this
+# process's Session commit hooks and have no TTL. That is exact because the
+# API runs as a single uvicorn worker and is the only writer; anything that
+# reads a database another process writes (the in-process MCP server) must
+# bypass them.
+STATS_CACHE_MAXSIZE = 128
+_stats_lock = threading.Lock()
+_stats_version = 0
+_stats_cache: OrderedDict[tuple[date, date], tuple[int, list[dict]]] = OrderedDict()
+_daily_report_cache: OrderedDict[date, tuple[int, DailyReport]] = OrderedDict()
 
-    stats_map: dict[date, dict] = {}
-    for row in rows:
-        day = stats_map.setdefault(
-            row.date, {"date": row.date, "total_hours": 0.0, "category_hours": {}}
-        )
-        day["total_hours"] += float(row.hours)
-        day["category_hours"][row.category.value] = float(row.hours)
 
-    return list(stats_map.values())
+def bump_stats_version() -> None:
+    """Invalidate every cached get_stats() result and daily report."""
+    global _stats_version
+    with _stats_lock:
+        _stats_version += 1
 
 
-def get_logs_in_range(db: Session, start_date: date, end_date: date):
-    from sqlalchemy.orm import joinedload
+def _mark_stats_dirty(db: Session) -> None:
+    # Deferred until commit so readers never cache uncommitted data under the
+    # new version.
+    db.info["stats_dirty"] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _track_log_entry_writes(session: Session, flush_context) -> None:
+    if any(
+        isinstance(obj, LogEntry)
+        for obj in chain(session.new, session.dirty, session.deleted)
+    ):
+        _mark_stats_dirty(session)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_stats_after_commit(session: Session) -> None:
+    if session.info.pop("stats_dirty", False):
+        bump_stats_version()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_stats_dirty(session: Session) -> None:
+    session.info.pop("stats_dirty", None)
 
-    return (
-        db.query(LogEntry)
-        .options(joinedload(LogEntry.project_rel))
-        .filter(LogEntry.date >= start_date, LogEntry.date <= end_date)
-        .order_by(LogEntry.date.asc(), LogEntry.id.asc())
-        .all()
-    )
 
+def _cache_lookup(cache: OrderedDict, key) -> tuple[int, Any]:
+    """Return (current version, cached value or None) for a versioned cache."""
+    with _stats_lock:
+        cached = cache.get(key)
+        if cached is not None and cached[0] == _stats_version:
+            cache.move_to_end(key)
+            return _stats_version, cached[1]
+        return _stats_version, None
 
-def _build_report_entry(entry: LogEntry) -> ReportEntry:
-    return ReportEntry(
-        date=entry.date,
-        uuid=entry.uuid,
-        previous_task_uuid=entry.previous_task_uuid,
-        category=entry.category,
-        project_id=entry.project_id,
-        project_name=entry.project_name,
-        task=entry.task,
-        hours=entry.hours,
-        additional_hours=entry.additional_hours,
-        status=entry.status,
-        notes=entry.notes,
+
+def _cache_store(cache: OrderedDict, key, version: int, value) -> None:
+    with _stats_lock:
+        cache[key] = (version, value)
+        cache.move_to_end(key)
+        while len(cache) > STATS_CACHE_MAXSIZE:
+            cache.popitem(last=False)
+
+
+def get_stats(db: Session, start_date: date, end_date: date):
+    """Return per-day hour totals, served from cache while no LogEntry changed.
+
+    The returned list is shared with the cache and must not be mutated.
+    """
+    key = (start_date, end_date)
+    version, stats = _cache_lookup(_stats_cache, key)
+    if stats is None:
+        stats = _compute_stats(db, start_date, end_date)
+        _cache_store(_stats_cache, key, version, stats)
+    return stats
+
+
+# One SUM(CASE ...) column per category, built once at import. Absent
+# categories sum to NULL and are left out of category_hours.
+_STATS_CATEGORY_COLUMNS = [
+    (category, func.sum(case((LogEntry.category == category, LogEntry.hours))))
+    for category in Category
+]
+
+
+def _compute_stats(db: Session, start_date: date, end_date: date) -> list[dict]:
+    # Pivoted to one row per day in SQL with conditional aggregation.
+    # Core select: aggregate rows only, nothing to hydrate into the ORM.
+    rows = db.execute(
+        lambda_stmt(
+            lambda: select(
+                LogEntry.date,
+                func.sum(LogEntry.hours).label("total_hours"),
+                *(expr for _, expr in _STATS_CATEGORY_COLUMNS),
+            )
+            .where(LogEntry.date >= start_date, LogEntry.date <= end_date)
+            .group_by(LogEntry.date)
+            .order_by(LogEntry.date.asc())
+        )
+    ).all()
+
+    return [
+        {
+            "date": row[0],
+            "total_hours": float(row[1]),
+            "category_hours": {
+                category.value: float(hours)
+                for (category, _), hours in zip(_STATS_CATEGORY_COLUMNS, row[2:])
+                if hours is not None
+            },
+        }
+        for row in rows
+    ]
+
+
+# ReportEntry fields as plain columns, with the project name joined in, so
+# reports never hydrate LogEntry or Project ORM objects.
+_REPORT_ENTRY_COLUMNS = (
+    LogEntry.date,
+    LogEntry.uuid,
+    LogEntry.previous_task_uuid,
+    LogEntry.category,
+    LogEntry.project_id,
+    Project.name.label("project_name"),
+    LogEntry.task,
+    LogEntry.hours,
+    LogEntry.additional_hours,
+    LogEntry.status,
+    LogEntry.notes,
+)
+
+
+def _report_entries_in_range(
+    db: Session, start_date: date, end_date: date
+) -> list[ReportEntry]:
+    rows = db.execute(
+        lambda_stmt(
+            lambda: select(*_REPORT_ENTRY_COLUMNS)
+            .outerjoin(Project, LogEntry.project_id == Project.id)
+            .where(LogEntry.date >= start_date, LogEntry.date <= end_date)
+            .order_by(LogEntry.date.asc(), LogEntry.id.asc())
+        )
     )
+    # Values come straight from typed columns; skip per-entry validation.
+    return [ReportEntry.model_construct(**row._mapping) for row in rows]
 
 
 def _build_report_totals(entries: list[ReportEntry]) -> ReportTotals:
@@ -325,13 +549,73 @@ def _build_report_totals(entries: list[ReportEntry]) -> ReportTotals:
     return ReportTotals(total_hours=total_hours, by_category=by_category)
 
 
-def build_daily_report(db: Session, target_date: date) -> DailyReport:
-    logs = get_logs_by_date(db, target_date)
-    entries = [_build_report_entry(entry) for entry in logs]
+def build_daily_report(
+    db: Session, target_date: date, *, use_cache: bool = True
+) -> DailyReport:
+    """Build the daily report, served from cache while no LogEntry changed.
+
+    The weekly report is assembled from these, so it shares the cache. The
+    returned report is shared with the cache and must not be mutated.
+
+    The cache is only invalidated by commits made in this process; callers
+    reading a database that another process writes to (the in-process MCP
+    server) pass use_cache=False.
+    """
+    if not use_cache:
+        return _build_daily_report(db, target_date)
+    version, report = _cache_lookup(_daily_report_cache, target_date)
+    if report is None:
+        report = _build_daily_report(db, target_date)
+        _cache_store(_daily_report_cache, target_date, version, report)
+    return report
+
+
+def _build_daily_report(db: Session, target_date: date) -> DailyReport:
+    entries = _report_entries_in_range(db, target_date, target_date)
     totals = _build_report_totals(entries)
     return DailyReport(date=target_date, entries=entries, totals=totals)
 
 
+def _daily_reports_in_range(
+    db: Session, start_date: date, end_date: date, use_cache: bool = True
+) -> list[DailyReport]:
+    """Daily reports for each day in the range, cached like build_daily_report().
+
+    Days missing from the cache are built from one range query instead of one
+    query per day. With use_cache=False every day is built and nothing is
+    stored.
+    """
+    days = [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+    ]
+    reports: dict[date, DailyReport] = {}
+    version: int | None = None
+    if use_cache:
+        for day in days:
+            day_version, report = _cache_lookup(_daily_report_cache, day)
+            if version is None:
+                version = day_version
+            if report is not None:
+                reports[day] = report
+
+    missing = [day for day in days if day not in reports]
+    if missing:
+        by_day: dict[date, list[ReportEntry]] = {day: [] for day in missing}
+        for entry in _report_entries_in_range(db, missing[0], missing[-1]):
+            if entry.date in by_day:
+                by_day[entry.date].append(entry)
+        for day, entries in by_day.items():
+            report = DailyReport(
+                date=day, entries=entries, totals=_build_report_totals(entries)
+            )
+            if use_cache:
+                _cache_store(_daily_report_cache, day, version, report)
+            reports[day] = report
+
+    return [reports[day] for day in days]
+
+
 def _week_bounds(anchor: date) -> tuple[date, date]:
     # Monday = 0, Sunday = 6
     offset = anchor.weekday()
@@ -358,7 +642,12 @@ def build_weekly_report(
     summary_qualitative: Optional[str] = None,
     summary_quantitative: Optional[str] = None,
     next_week_plan: Optional[list[str]] = None,
+    use_cache: bool = True,
 ) -> WeeklyReport:
+    """Build the weekly report from the week's daily reports.
+
+    use_cache is passed through to the daily reports; see build_daily_report().
+    """
     week_start, week_end = _week_bounds(week_anchor)
     # Accumulate the weekly report from daily reports so weekly data is consistent
     # with the daily report generation path.
@@ -366,17 +655,13 @@ def build_weekly_report(
     total_hours = 0.0
     by_category: dict[str, float] = {}
 
-    current = week_start
-    while current <= week_end:
-        daily = build_daily_report(db, current)
+    for daily in _daily_reports_in_range(db, week_start, week_end, use_cache):
         entries.extend(daily.entries)
 
         total_hours += daily.totals.total_hours
         for category_key, hours in daily.totals.by_category.items():
             by_category[category_key] = by_category.get(category_key, 0.0) + hours
 
-        current = current + timedelta(days=1)
-
     totals = ReportTotals(total_hours=total_hours, by_category=by_category)
 
     buckets: dict[str, list[ReportEntry]] = {
@@ -407,42 +692,61 @@ def build_weekly_report(
     )
 
 
+# Trigram FTS5 mirror of projects.name, maintained by triggers (see db.ensure_schema).
+_projects_fts = table("projects_fts", column("rowid"), column("name"))
+_TRIGRAM_LENGTH = 3
+
+
+def _project_name_matches(search: str) -> ColumnElement[bool]:
+    """Case-insensitive substring match on Project.name.
+
+    Uses the projects_fts trigram index when available instead of scanning and
+    case-folding every project row. Terms shorter than one trigram cannot use
+    the index, so they scan projects directly.
+    """
+    search_term = f"%{search.lower()}%"
+    if project_fts_enabled() and len(search) >= _TRIGRAM_LENGTH:
+        return Project.id.in_(
+            select(_projects_fts.c.rowid).where(_projects_fts.c.name.like(search_term))
+        )
+    return Project.name.ilike(search_term)
+
+
 # Project CRUD operations
 def get_projects(db: Session, search: Optional[str] = None):
     """Get all projects, optionally filtered by search term."""
-    query = db.query(Project)
+    query = _with_strict_loading(db.query(Project))
     if search:
-        search_term = f"%{search.lower()}%"
-        query = query.filter(Project.name.ilike(search_term))
+        query = query.filter(_project_name_matches(search))
     return query.order_by(Project.name.asc()).all()
 
 
 def get_project(db: Session, project_id: int):
     """Get a single project by ID."""
-    return db.query(Project).filter(Project.id == project_id).first()
+    return db.get(Project, project_id, options=_loader_options())
 
 
 def create_project(db: Session, project: ProjectCreate):
     """Create a new project. Enforces uniqueness of project name."""
-    # Check if project with same name already exists
-    existing = db.query(Project).filter(Project.name == project.name).first()
-    if existing:
-        raise ValueError(f"Project with name '{project.name}' already exists")
-
     project_dict = project.dict()
     new_project = Project(**project_dict)
     db.add(new_project)
-    db.commit()
-    db.refresh(new_project)
+    try:
+        # The UNIQUE index on projects.name rejects duplicates atomically.
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if "UNIQUE constraint failed: projects.name" not in str(e.orig):
+            raise
+        raise ValueError(f"Project with name '{project.name}' already exists")
     return new_project
 
 
 def search_projects(db: Session, query: str):
     """Search projects by name (case-insensitive partial match)."""
-    search_term = f"%{query.lower()}%"
     return (
-        db.query(Project)
-        .filter(Project.name.ilike(search_term))
+        _with_strict_loading(db.query(Project))
+        .filter(_project_name_matches(query))
         .order_by(Project.name.asc())
         .all()
     )
@@ -450,17 +754,29 @@ def search_projects(db: Session, query: str):
 
 # TimeSpan CRUD operations
 def get_timespans_for_entry(db: Session, log_entry_id: int):
-    merge_connectable_timespans_for_entry(db, log_entry_id)
-    return (
-        db.query(TimeSpan)
-        .filter(TimeSpan.log_entry_id == log_entry_id)
+    """Return an entry's TimeSpans as read-only Core rows.
+
+    Rows expose the TimeSpanRead fields as attributes but are not ORM objects,
+    so nothing is added to the identity map; use get_timespan() to modify one.
+    This is a pure read: every write path merges connectable spans itself.
+    """
+    # log_entry_id is picked up from the closure as a bound parameter.
+    stmt = lambda_stmt(
+        lambda: select(
+            TimeSpan.id,
+            TimeSpan.log_entry_id,
+            TimeSpan.start_timestamp,
+            TimeSpan.end_timestamp,
+            TimeSpan.created_at,
+        )
+        .where(TimeSpan.log_entry_id == log_entry_id)
         .order_by(TimeSpan.start_timestamp.asc(), TimeSpan.id.asc())
-        .all()
     )
+    return db.execute(stmt).all()
 
 
 def get_timespan(db: Session, timespan_id: int):
-    return db.query(TimeSpan).filter(TimeSpan.id == timespan_id).first()
+    return db.get(TimeSpan, timespan_id, options=_loader_options())
 
 
 def get_active_timespan(db: Session) -> TimeSpan | None:
@@ -471,15 +787,18 @@ def get_active_timespan(db: Session) -> TimeSpan | None:
     Note: we enforce at most one open TimeSpan via start_timespan_for_entry(),
     but we still pick the most recent one defensively.
     """
-    return (
-        db.query(TimeSpan)
-        .filter(TimeSpan.end_timestamp.is_(None))
+    stmt = lambda_stmt(
+        lambda: select(TimeSpan)
+        .where(TimeSpan.end_timestamp.is_(None))
         .order_by(TimeSpan.created_at.desc())
-        .first()
+        .limit(1)
     )
+    return db.scalars(stmt).first()
 
 
-def end_timespan(db: Session, timespan_id: int) -> TimeSpan | None:
+def end_timespan(
+    db: Session, timespan_id: int, now: datetime | None = None
+) -> TimeSpan | None:
     """End an open TimeSpan (set end_timestamp) and recalc LogEntry.hours.
 
     - Rounds to nearest 15 minutes.
@@ -489,62 +808,64 @@ def end_timespan(db: Session, timespan_id: int) -> TimeSpan | None:
     if not timespan:
         return None
 
+    now = _resolve_now(now)
     if timespan.end_timestamp:
-        # Already ended; no-op.
+        # Already ended; only merge.
         merge_connectable_timespans_for_entry(
-            db, timespan.log_entry_id, prefer_timespan_id=timespan.id
+            db, timespan.log_entry_id, prefer_timespan_id=timespan.id, now=now
         )
-        return timespan
+    else:
+        _close_timespan(db, timespan, now)
+    db.commit()
+    return timespan
 
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
-    start_ts, end_ts = normalize_span(timespan.start_timestamp, now)
 
+def _close_timespan(db: Session, timespan: TimeSpan, now: datetime) -> None:
+    """End an open TimeSpan at `now`, recalc hours and merge, without committing."""
+    start_ts, end_ts = normalize_span(timespan.start_timestamp, now)
     timespan.start_timestamp = start_ts
     timespan.end_timestamp = end_ts
-    db.commit()
-    db.refresh(timespan)
-
-    entry = get_log(db, timespan.log_entry_id)
-    if entry:
-        entry.hours = calculate_total_hours(db, entry.id, entry.additional_hours)
-        db.commit()
-        db.refresh(entry)
+    db.flush()
 
+    recalculate_entry_hours(db, timespan.log_entry_id)
     merge_connectable_timespans_for_entry(
-        db, timespan.log_entry_id, prefer_timespan_id=timespan.id
+        db, timespan.log_entry_id, prefer_timespan_id=timespan.id, now=now
     )
-    return timespan
 
 
-def start_timespan_for_entry(db: Session, log_entry_id: int) -> TimeSpan | None:
+def start_timespan_for_entry(
+    db: Session, log_entry_id: int, now: datetime | None = None
+) -> TimeSpan | None:
     """Start a new running TimeSpan (end_timestamp=NULL) for the given LogEntry.
 
     Active policy: if another TimeSpan is currently running (open), we auto-end it
     (auto-pause) before creating the new running TimeSpan.
     """
-    entry = get_log(db, log_entry_id)
+    entry = _get_entry_lite(db, log_entry_id)
     if not entry:
         return None
 
+    now = _resolve_now(now)
     active = get_active_timespan(db)
     if active:
         # If the active session is already for this entry, just return it.
         if active.log_entry_id == log_entry_id:
             return active
         # Otherwise auto-pause the existing active session.
-        end_timespan(db, active.id)
+        _close_timespan(db, active, now)
 
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
     start_ts = round_to_quarter_hour(now)
 
     # If the most recent span for this entry is connectable (<= 15m gap),
     # reopen it instead of creating a new row.
-    last_span = (
-        db.query(TimeSpan)
-        .filter(TimeSpan.log_entry_id == log_entry_id)
-        .order_by(TimeSpan.start_timestamp.desc(), TimeSpan.id.desc())
-        .first()
-    )
+    last_span = db.scalars(
+        lambda_stmt(
+            lambda: select(TimeSpan)
+            .where(TimeSpan.log_entry_id == log_entry_id)
+            .order_by(TimeSpan.start_timestamp.desc(), TimeSpan.id.desc())
+            .limit(1)
+        )
+    ).first()
     if last_span:
         if last_span.end_timestamp is None:
             return last_span
@@ -553,15 +874,11 @@ def start_timespan_for_entry(db: Session, log_entry_id: int) -> TimeSpan | None:
                 minutes=QUARTER_HOUR_MINUTES
             ):
                 last_span.end_timestamp = None
-                db.commit()
-                db.refresh(last_span)
+                db.flush()
 
                 # Recalculate total hours for the log entry (open spans don't count).
-                entry.hours = calculate_total_hours(
-                    db, entry.id, entry.additional_hours
-                )
+                recalculate_entry_hours(db, entry.id)
                 db.commit()
-                db.refresh(entry)
                 return last_span
 
     timespan = TimeSpan(
@@ -570,15 +887,17 @@ def start_timespan_for_entry(db: Session, log_entry_id: int) -> TimeSpan | None:
         end_timestamp=None,
     )
     db.add(timespan)
-    db.commit()
-    db.refresh(timespan)
+    db.flush()
     merge_connectable_timespans_for_entry(
-        db, log_entry_id, prefer_timespan_id=timespan.id
+        db, log_entry_id, prefer_timespan_id=timespan.id, now=now
     )
+    db.commit()
     return timespan
 
 
-def adjust_timespan(db: Session, timespan_id: int, hours: float):
+def adjust_timespan(
+    db: Session, timespan_id: int, hours: float, now: datetime | None = None
+):
     """Adjust TimeSpan end_timestamp by adding/subtracting hours.
     Rounds to nearest 0.25 hour increment."""
     timespan = get_timespan(db, timespan_id)
@@ -589,8 +908,9 @@ def adjust_timespan(db: Session, timespan_id: int, hours: float):
         # If no end_timestamp, can't adjust
         return timespan
 
+    now = _resolve_now(now)
     # Calculate new end_timestamp
-    hours_rounded = round(hours * 4) / 4.0
+    hours_rounded = quantize_hours(hours)
     adjustment = timedelta(hours=hours_rounded)
     new_end = timespan.end_timestamp + adjustment
 
@@ -599,6 +919,7 @@ def adjust_timespan(db: Session, timespan_id: int, hours: float):
         incoming_start=timespan.start_timestamp,
         incoming_end=new_end,
         exclude_timespan_id=timespan.id,
+        now=now,
     )
 
     # Ensure new_end is after start_timestamp
@@ -606,71 +927,74 @@ def adjust_timespan(db: Session, timespan_id: int, hours: float):
 
     timespan.start_timestamp = new_start
     timespan.end_timestamp = new_end
-    db.commit()
-    db.refresh(timespan)
+    db.flush()
 
     # Recalculate total hours for the log entry
-    entry = get_log(db, timespan.log_entry_id)
-    if entry:
-        entry.hours = calculate_total_hours(db, entry.id, entry.additional_hours)
-        db.commit()
-        db.refresh(entry)
-
+    recalculate_entry_hours(db, timespan.log_entry_id)
     merge_connectable_timespans_for_entry(
-        db, timespan.log_entry_id, prefer_timespan_id=timespan.id
+        db, timespan.log_entry_id, prefer_timespan_id=timespan.id, now=now
     )
+    db.commit()
     return timespan
 
 
-def update_timespan(db: Session, timespan_id: int, update: TimeSpanUpdate):
+def update_timespan(
+    db: Session,
+    timespan_id: int,
+    update: TimeSpanUpdate,
+    now: datetime | None = None,
+):
     """Update TimeSpan start_timestamp and end_timestamp.
     Rounds to nearest 0.25 hour increment and ensures minimum duration of 0.25h."""
     timespan = get_timespan(db, timespan_id)
     if not timespan:
         return None
 
+    now = _resolve_now(now)
     new_start, new_end = normalize_span(update.start_timestamp, update.end_timestamp)
     maybe_close_open_timespan(
         db,
         incoming_start=new_start,
         incoming_end=new_end,
         exclude_timespan_id=timespan.id,
+        now=now,
     )
 
     timespan.start_timestamp = new_start
     timespan.end_timestamp = new_end
-    db.commit()
-    db.refresh(timespan)
+    db.flush()
 
     # Recalculate total hours for the log entry
-    entry = get_log(db, timespan.log_entry_id)
-    if entry:
-        entry.hours = calculate_total_hours(db, entry.id, entry.additional_hours)
-        db.commit()
-        db.refresh(entry)
-
+    recalculate_entry_hours(db, timespan.log_entry_id)
     merge_connectable_timespans_for_entry(
-        db, timespan.log_entry_id, prefer_timespan_id=timespan.id
+        db, timespan.log_entry_id, prefer_timespan_id=timespan.id, now=now
     )
+    db.commit()
     return timespan
 
 
 def create_timespan_for_entry(
-    db: Session, log_entry_id: int, start_timestamp: datetime, end_timestamp: datetime
+    db: Session,
+    log_entry_id: int,
+    start_timestamp: datetime,
+    end_timestamp: datetime,
+    now: datetime | None = None,
 ):
     """Create a new TimeSpan for a log entry.
 
     Rounds to nearest 0.25 hour increment and ensures minimum duration of 0.25h.
     """
-    entry = get_log(db, log_entry_id)
+    entry = _get_entry_lite(db, log_entry_id)
     if not entry:
         return None
 
+    now = _resolve_now(now)
     new_start, new_end = normalize_span(start_timestamp, end_timestamp)
     maybe_close_open_timespan(
         db,
         incoming_start=new_start,
         incoming_end=new_end,
+        now=now,
     )
 
     timespan = TimeSpan(
@@ -679,20 +1003,67 @@ def create_timespan_for_entry(
         end_timestamp=new_end,
     )
     db.add(timespan)
-    db.commit()
-    db.refresh(timespan)
+    db.flush()
 
     # Recalculate total hours for the log entry
-    entry.hours = calculate_total_hours(db, entry.id, entry.additional_hours)
-    db.commit()
-    db.refresh(entry)
-
+    recalculate_entry_hours(db, entry.id)
     merge_connectable_timespans_for_entry(
-        db, log_entry_id, prefer_timespan_id=timespan.id
+        db, log_entry_id, prefer_timespan_id=timespan.id, now=now
     )
+    db.commit()
     return timespan
 
 
+def create_timespans_batch(
+    db: Session, items: list[TimeSpanBatchItem], now: datetime | None = None
+) -> list[TimeSpan] | None:
+    """Create many TimeSpans with a single multi-row INSERT.
+
+    Each span is normalized like create_timespan_for_entry(); hours are then
+    recalculated and connectable spans merged once per affected entry.
+    Returns None if any referenced log entry does not exist. Spans absorbed by
+    a merge are left out of the result.
+    """
+    if not items:
+        return []
+
+    entry_ids = {item.log_entry_id for item in items}
+    found_ids = set(db.scalars(select(LogEntry.id).where(LogEntry.id.in_(entry_ids))))
+    if found_ids != entry_ids:
+        return None
+
+    now = _resolve_now(now)
+    rows: list[dict] = []
+    for item in items:
+        new_start, new_end = normalize_span(item.start_timestamp, item.end_timestamp)
+        maybe_close_open_timespan(
+            db, incoming_start=new_start, incoming_end=new_end, now=now
+        )
+        rows.append(
+            {
+                "log_entry_id": item.log_entry_id,
+                "start_timestamp": new_start,
+                "end_timestamp": new_end,
+                # ORM bulk INSERT skips mapper events, so set it explicitly.
+                "duration_seconds": span_duration_seconds(new_start, new_end),
+                "created_at": now,
+            }
+        )
+
+    # RETURNING rows only follow the parameter order when asked to.
+    timespans = list(
+        db.scalars(
+            insert(TimeSpan).returning(TimeSpan, sort_by_parameter_order=True), rows
+        )
+    )
+
+    for entry_id in sorted(entry_ids):
+        recalculate_entry_hours(db, entry_id)
+        merge_connectable_timespans_for_entry(db, entry_id, now=now)
+    db.commit()
+    return [ts for ts in timespans if not inspect(ts).was_deleted]
+
+
 def delete_timespan(db: Session, timespan_id: int):
     """Delete a TimeSpan and recalculate log entry hours."""
     timespan = get_timespan(db, timespan_id)
@@ -701,38 +1072,38 @@ def delete_timespan(db: Session, timespan_id: int):
 
     log_entry_id = timespan.log_entry_id
     db.delete(timespan)
-    db.commit()
+    db.flush()
 
     # Recalculate total hours for the log entry
-    entry = get_log(db, log_entry_id)
-    if entry:
-        entry.hours = calculate_total_hours(db, entry.id, entry.additional_hours)
-        db.commit()
-        db.refresh(entry)
+    recalculate_entry_hours(db, log_entry_id)
+    db.commit()
 
     return True
 
 
+def _settled_timespan_seconds(log_entry_id: int) -> Select:
+    """Build a SELECT summing settled TimeSpan durations (in seconds) for an entry.
+
+    Settled-hours policy: open sessions (end_timestamp is NULL) don't count
+    toward LogEntry.hours until they are ended; their duration_seconds is NULL
+    so SUM() skips them.
+    """
+    return select(func.coalesce(func.sum(TimeSpan.duration_seconds), 0)).where(
+        TimeSpan.log_entry_id == log_entry_id
+    )
+
+
 def calculate_timespan_hours(db: Session, log_entry_id: int) -> float:
     """Calculate hours from all TimeSpans for an entry.
-    Rounds to nearest 0.25 hour increment."""
-    timespans = get_timespans_for_entry(db, log_entry_id)
-    total_hours = 0.0
+    Rounds to nearest 0.25 hour increment.
 
-    for span in timespans:
-        # Settled-hours policy: open sessions (end_timestamp is NULL) don't count
-        # toward LogEntry.hours until they are ended.
-        if not span.end_timestamp:
-            continue
-        end_time = span.end_timestamp
-        duration = (end_time - span.start_timestamp).total_seconds() / 3600.0
-        total_hours += duration
-
-    # Round to nearest 0.25 hour increment
-    if total_hours > 0:
-        total_hours = round(total_hours * 4) / 4.0
+    Sums the stored duration_seconds in SQL so the TimeSpan rows never need to
+    be loaded as ORM objects.
+    """
+    total_seconds = db.execute(_settled_timespan_seconds(log_entry_id)).scalar()
+    total_hours = (total_seconds or 0) / 3600.0
 
-    return total_hours
+    return quantize_hours(total_hours)
 
 
 def calculate_total_hours(
@@ -741,25 +1112,77 @@ def calculate_total_hours(
     """Calculate total hours = TimeSpan hours + additional hours.
     Rounds to nearest 0.25 hour increment."""
     timespan_hours = calculate_timespan_hours(db, log_entry_id)
-    additional_hours_rounded = round(additional_hours * 4) / 4.0
-    total = timespan_hours + additional_hours_rounded
-    return round(total * 4) / 4.0
+    return quantize_hours(timespan_hours + quantize_hours(additional_hours))
+
+
+def _sql_quantize_hours(hours: ColumnElement) -> ColumnElement:
+    """SQL twin of quantize_hours(): nearest 0.25h, ties round half to even.
+
+    SQLite's round() sends ties away from zero, so ties are resolved by hand.
+    Hours are never negative, so the integer CAST is a floor.
+    """
+    quarters = hours * 4
+    whole = cast(quarters, Integer)
+    fraction = quarters - whole
+    return (
+        case(
+            (fraction > 0.5, whole + 1),
+            (fraction < 0.5, whole),
+            else_=whole + whole % 2,
+        )
+        * 0.25
+    )
+
+
+def recalculate_entry_hours(db: Session, log_entry_id: int) -> None:
+    """Recompute LogEntry.hours = TimeSpan hours + additional hours in SQL.
+
+    Same result as calculate_total_hours() (both terms and the total are
+    quantized with the same half-to-even rule), but issued as a single
+    UPDATE ... SET hours = (SELECT ...) so there is no separate read round
+    trip. Pending changes must be flushed first (the session does not
+    autoflush). The ORM attribute is expired and reloads if the caller reads it.
+    """
+    # The span total is quantized in a derived table so the (repeated)
+    # rounding expression references a column, not the SUM() itself.
+    settled = select(
+        _sql_quantize_hours(
+            func.coalesce(func.sum(TimeSpan.duration_seconds), 0) / 3600.0
+        ).label("hours")
+    ).where(TimeSpan.log_entry_id == log_entry_id).subquery()
+    total_hours = _sql_quantize_hours(
+        settled.c.hours + _sql_quantize_hours(LogEntry.additional_hours)
+    )
+    _mark_stats_dirty(db)
+    db.execute(
+        update(LogEntry)
+        .where(LogEntry.id == log_entry_id)
+        .values(hours=select(total_hours).scalar_subquery())
+        .execution_options(synchronize_session="fetch")
+    )
 
 
 # Timer CRUD operations
-def get_active_timer(db: Session):
-    """Get the currently active timer (running or paused)."""
-    return db.query(Timer).first()
+# Closed-span hours of the timer's log entry, as a correlated subquery.
+_TIMER_ELAPSED_HOURS = (
+    select(func.coalesce(func.sum(TimeSpan.duration_seconds), 0))
+    .where(TimeSpan.log_entry_id == Timer.log_entry_id)
+    .correlate(Timer)
+    .scalar_subquery()
+    / 3600.0
+)
 
 
-def create_timer(db: Session, request: TimerStartRequest):
-    """Create a new timer, enforcing only one active timer."""
-    # Stop/delete any existing active timer
-    existing_timer = get_active_timer(db)
-    if existing_timer:
-        db.delete(existing_timer)
-        db.commit()
+def create_timer(
+    db: Session, request: TimerStartRequest, now: datetime | None = None
+):
+    """Create a new timer, enforcing only one active timer.
 
+    The timers table holds at most one row (id = TIMER_SINGLETON_ID), so an
+    existing timer is overwritten in place (UPDATE ... RETURNING) and a row is
+    only inserted when none exists yet. Everything is committed once.
+    """
+    now = _resolve_now(now)
     log_entry_id = request.log_entry_id
 
     # If no log_entry_id provided, create new log entry
@@ -776,29 +1199,36 @@ def create_timer(db: Session, request: TimerStartRequest):
             status="Completed",
         )
         db.add(new_entry)
-        db.commit()
-        db.refresh(new_entry)
+        db.flush()
         log_entry_id = new_entry.id
 
-    # Create new timer
-    # Use timezone-aware UTC datetime, then convert to naive for database storage
-    # (SQLAlchemy DateTime columns store as naive UTC)
-    timer = Timer(
-        log_entry_id=log_entry_id,
-        started_at=round_to_quarter_hour(
-            datetime.now(timezone.utc).replace(tzinfo=None)
-        ),
-        status=TimerStatus.RUNNING,
-    )
-    db.add(timer)
+    values = {
+        "log_entry_id": log_entry_id,
+        "started_at": round_to_quarter_hour(now),
+        "status": TimerStatus.RUNNING,
+        "date": None,
+        "category": None,
+        "project_id": None,
+        "task": None,
+    }
+    # Replace any existing active timer
+    timer = db.scalars(
+        update(Timer)
+        .where(Timer.id == TIMER_SINGLETON_ID)
+        .values(**values)
+        .returning(Timer)
+    ).first()
+    if timer is None:
+        # Create new timer
+        timer = Timer(id=TIMER_SINGLETON_ID, **values)
+        db.add(timer)
     db.commit()
-    db.refresh(timer)
     return timer
 
 
-def pause_timer(db: Session, timer_id: int):
+def pause_timer(db: Session, timer_id: int, now: datetime | None = None):
     """Pause timer and create TimeSpan record."""
-    timer = db.query(Timer).filter(Timer.id == timer_id).first()
+    timer = db.get(Timer, timer_id)
     if not timer:
         return None
 
@@ -806,8 +1236,7 @@ def pause_timer(db: Session, timer_id: int):
         return timer
 
     # Create TimeSpan for the current session
-    # Use timezone-aware UTC datetime, then convert to naive for database storage
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    now = _resolve_now(now)
     start_ts, end_ts = normalize_span(timer.started_at, now)
     timespan = TimeSpan(
         log_entry_id=timer.log_entry_id,
@@ -818,17 +1247,17 @@ def pause_timer(db: Session, timer_id: int):
 
     # Update timer status
     timer.status = TimerStatus.PAUSED
-    db.commit()
-    db.refresh(timer)
+    db.flush()
     merge_connectable_timespans_for_entry(
-        db, timer.log_entry_id, prefer_timespan_id=timespan.id
+        db, timer.log_entry_id, prefer_timespan_id=timespan.id, now=now
     )
+    db.commit()
     return timer
 
 
-def resume_timer(db: Session, timer_id: int):
+def resume_timer(db: Session, timer_id: int, now: datetime | None = None):
     """Resume paused timer with new started_at timestamp."""
-    timer = db.query(Timer).filter(Timer.id == timer_id).first()
+    timer = db.get(Timer, timer_id)
     if not timer:
         return None
 
@@ -836,24 +1265,19 @@ def resume_timer(db: Session, timer_id: int):
         return timer
 
     # Set new started_at and status
-    # Use timezone-aware UTC datetime, then convert to naive for database storage
-    timer.started_at = round_to_quarter_hour(
-        datetime.now(timezone.utc).replace(tzinfo=None)
-    )
+    timer.started_at = round_to_quarter_hour(_resolve_now(now))
     timer.status = TimerStatus.RUNNING
     db.commit()
-    db.refresh(timer)
     return timer
 
 
-def stop_timer(db: Session, timer_id: int):
+def stop_timer(db: Session, timer_id: int, now: datetime | None = None):
     """Stop timer, create final TimeSpan, calculate hours, and delete timer."""
-    timer = db.query(Timer).filter(Timer.id == timer_id).first()
+    timer = db.get(Timer, timer_id)
     if not timer:
         return None
 
-    # Use timezone-aware UTC datetime, then convert to naive for database storage
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    now = _resolve_now(now)
     start_ts, end_ts = normalize_span(timer.started_at, now)
 
     # Create final TimeSpan
@@ -863,22 +1287,18 @@ def stop_timer(db: Session, timer_id: int):
         end_timestamp=end_ts,
     )
     db.add(timespan)
+    db.flush()
 
     # Update log entry hours = TimeSpan hours + additional hours
+    recalculate_entry_hours(db, timer.log_entry_id)
     entry = get_log(db, timer.log_entry_id)
-    if entry:
-        entry.hours = calculate_total_hours(
-            db, timer.log_entry_id, entry.additional_hours
-        )
-        db.commit()
-        db.refresh(entry)
 
+    # Delete timer in the same transaction as the final TimeSpan.
+    log_entry_id = timer.log_entry_id
+    db.delete(timer)
     merge_connectable_timespans_for_entry(
-        db, timer.log_entry_id, prefer_timespan_id=timespan.id
+        db, log_entry_id, prefer_timespan_id=timespan.id, now=now
     )
-
-    # Delete timer
-    db.delete(timer)
     db.commit()
 
     return entry
@@ -886,10 +1306,119 @@ def stop_timer(db: Session, timer_id: int):
 
 def delete_timer(db: Session, timer_id: int):
     """Cancel timer without saving."""
-    timer = db.query(Timer).filter(Timer.id == timer_id).first()
+    timer = db.get(Timer, timer_id)
     if not timer:
         return None
 
     db.delete(timer)
     db.commit()
     return timer
+
+
+# Snapshots of GET /timers/active and GET /timespans/active, which the UI
+# polls while nothing changes. Versioned like the stats caches (see above):
+# any committed write (flushed objects or an INSERT/UPDATE/DELETE statement)
+# bumps the version, so a snapshot is only served while the database is
+# untouched.
+_active_lock = threading.Lock()
+_active_version = 0
+# name -> (version, snapshot or None)
+_active_cache: dict[str, tuple[int, Any]] = {}
+
+
+def bump_active_version() -> None:
+    """Invalidate the cached active timer and active timespan snapshots."""
+    global _active_version
+    with _active_lock:
+        _active_version += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _track_active_flush(session: Session, flush_context) -> None:
+    if session.new or session.dirty or session.deleted:
+        session.info["active_dirty"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_active_statements(orm_execute_state: ORMExecuteState) -> None:
+    # Bulk INSERT/UPDATE statements (create_timer, batches) skip the flush.
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["active_dirty"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_active_after_commit(session: Session) -> None:
+    if session.info.pop("active_dirty", False):
+        bump_active_version()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_active_dirty(session: Session) -> None:
+    session.info.pop("active_dirty", None)
+
+
+def _cached_active(name: str, load) -> Any:
+    with _active_lock:
+        version = _active_version
+        cached = _active_cache.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+    snapshot = load()
+    with _active_lock:
+        _active_cache[name] = (version, snapshot)
+    return snapshot
+
+
+# Snapshots are read as plain column rows: the polling path never needs an
+# ORM instance, its identity-map entry or attribute instrumentation.
+_ACTIVE_TIMER_COLUMNS = (
+    Timer.id,
+    Timer.log_entry_id,
+    Timer.started_at,
+    Timer.status,
+    Timer.date,
+    Timer.category,
+    Timer.project_id,
+    Timer.task,
+    _TIMER_ELAPSED_HOURS.label("elapsed_hours"),
+)
+
+
+def read_active_timer(db: Session) -> ActiveTimerRead | None:
+    """Cached snapshot of the currently active timer (running or paused).
+
+    elapsed_hours carries the closed-span total of the timer's log entry,
+    summed by a correlated subquery in the same SELECT, so pollers do not
+    need a follow-up GET /logs/{id}/timespans. The running span's share is
+    still derived client-side from started_at.
+    """
+
+    def load() -> ActiveTimerRead | None:
+        # Singleton row: fetch by primary key.
+        row = db.execute(
+            select(*_ACTIVE_TIMER_COLUMNS).where(Timer.id == TIMER_SINGLETON_ID)
+        ).first()
+        return ActiveTimerRead.model_validate(row._asdict()) if row else None
+
+    return _cached_active("timer", load)
+
+
+def read_active_timespan(db: Session) -> TimeSpanRead | None:
+    """Cached TimeSpanRead snapshot of get_active_timespan(), for polling readers."""
+
+    def load() -> TimeSpanRead | None:
+        row = db.execute(
+            select(
+                TimeSpan.id,
+                TimeSpan.log_entry_id,
+                TimeSpan.start_timestamp,
+                TimeSpan.end_timestamp,
+                TimeSpan.created_at,
+            )
+            .where(TimeSpan.end_timestamp.is_(None))
+            .order_by(TimeSpan.created_at.desc())
+            .limit(1)
+        ).first()
+        return TimeSpanRead.model_validate(row._asdict()) if row else None
+
+    return _cached_active("timespan", load)
@@ -1,35 +1,108 @@
 import os
 from pathlib import Path
-import uuid as uuidlib
+import sqlite3
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 DEFAULT_DB_PATH = "sqlite:///./app.db"
 DATABASE_URL = os.getenv("DATABASE_URL", DEFAULT_DB_PATH)
 
+# crud writes rely on INSERT/UPDATE ... RETURNING (SQLite 3.35+); there is no
+# fallback path for older libraries.
+MIN_SQLITE_VERSION = (3, 35, 0)
+
 connect_args = {}
+sqlite_file_backed = False
 if DATABASE_URL.startswith("sqlite"):
+    if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+        raise RuntimeError(
+            f"SQLite {'.'.join(map(str, MIN_SQLITE_VERSION))} or newer is required "
+            f"(found {sqlite3.sqlite_version})"
+        )
     connect_args = {"check_same_thread": False}
 
     if DATABASE_URL.startswith("sqlite:///"):
         db_path = DATABASE_URL.replace("sqlite:///", "", 1)
         if db_path and db_path != ":memory:":
             Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            sqlite_file_backed = True
+
+# Handlers are sync and run in Starlette's threadpool (40 threads by
+# default); size the pool so those threads don't queue on checkout.
+engine_kwargs = {}
+if not DATABASE_URL.startswith("sqlite"):
+    # Networked databases: drop connections the server closed while idle.
+    engine_kwargs = {
+        "pool_size": 20,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+    }
+elif sqlite_file_backed:
+    engine_kwargs = {"pool_size": 20, "max_overflow": 20}
+else:
+    # In-memory SQLite: every pooled connection would be a separate empty
+    # database, so all threads share the single connection.
+    engine_kwargs = {"poolclass": StaticPool}
 
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(DATABASE_URL, connect_args=connect_args, **engine_kwargs)
+
+
+if DATABASE_URL.startswith("sqlite"):
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        # Every user action commits; WAL + synchronous=NORMAL avoids an fsync
+        # of the main database file per commit (still durable across crashes
+        # of the app, only the last commits can be lost on power failure).
+        cursor = dbapi_connection.cursor()
+        if sqlite_file_backed:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.close()
+
+
+# autoflush=False: reads issued in the middle of a write (get_log, the hours
+# recalculation) never trigger an implicit flush; write paths call
+# db.flush() explicitly before a query that has to see pending rows.
+# expire_on_commit=False: attributes set during a write stay loaded after
+# commit, so handlers can return the object without a re-SELECT.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 Base = declarative_base()
 
+# Stored in PRAGMA user_version once ensure_schema() has brought a database up
+# to date. Bump it whenever ensure_schema() gains a new upgrade step or the
+# models gain a new table (create_all() is skipped on stamped databases).
+SCHEMA_VERSION = 4
+
+# Set by ensure_schema() once the projects_fts trigram index is in place.
+_project_fts_enabled = False
+
+
+def project_fts_enabled() -> bool:
+    """Whether project name search can use the projects_fts trigram index."""
+    return _project_fts_enabled
+
+
 def ensure_schema(engine):
-    """Best-effort schema upgrade for SQLite without Alembic.
+    """Create missing tables and best-effort upgrade SQLite without Alembic.
 
     This project uses `Base.metadata.create_all()` (no migrations). SQLite won't
-    add new columns automatically, so we patch the schema at startup.
+    add new columns automatically, so we patch the schema at startup. A
+    database already stamped with SCHEMA_VERSION skips both steps.
     """
     if not str(engine.url).startswith("sqlite"):
-        # No-op for non-sqlite (not currently used in this repo).
+        # Non-sqlite (not currently used in this repo): tables only.
+        Base.metadata.create_all(bind=engine)
         return
 
     def _has_table(conn, table_name: str) -> bool:
@@ -43,10 +116,133 @@ def ensure_schema(engine):
         rows = conn.execute(text(f"PRAGMA table_info({table_name})")).mappings().all()
         return {str(r["name"]) for r in rows}
 
-    with engine.begin() as conn:
-        if not _has_table(conn, "log_entries"):
+    def _ensure_project_fts(conn) -> bool:
+        # FTS5 trigram tokenizer (SQLite >= 3.34) indexes substrings, so
+        # `name LIKE '%term%'` is answered from the index, case-insensitively.
+        created = not _has_table(conn, "projects_fts")
+        try:
+            conn.execute(
+                text(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5("
+                    "name, content='projects', content_rowid='id', tokenize='trigram')"
+                )
+            )
+        except OperationalError:
+            # SQLite built without FTS5/trigram: search falls back to ILIKE.
+            return False
+
+        conn.execute(
+            text(
+                "CREATE TRIGGER IF NOT EXISTS projects_fts_ai AFTER INSERT ON projects BEGIN "
+                "INSERT INTO projects_fts(rowid, name) VALUES (new.id, new.name); END"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TRIGGER IF NOT EXISTS projects_fts_ad AFTER DELETE ON projects BEGIN "
+                "INSERT INTO projects_fts(projects_fts, rowid, name) VALUES ('delete', old.id, old.name); END"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE TRIGGER IF NOT EXISTS projects_fts_au AFTER UPDATE ON projects BEGIN "
+                "INSERT INTO projects_fts(projects_fts, rowid, name) VALUES ('delete', old.id, old.name); "
+                "INSERT INTO projects_fts(rowid, name) VALUES (new.id, new.name); END"
+            )
+        )
+        if created:
+            # Index projects that existed before the FTS table.
+            conn.execute(text("INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')"))
+        return True
+
+    def _ensure_timer_singleton(conn) -> None:
+        # Older databases used autoincrement ids; keep only the newest timer
+        # and move it to the singleton id (models.TIMER_SINGLETON_ID).
+        conn.execute(
+            text("DELETE FROM timers WHERE id <> (SELECT MAX(id) FROM timers)")
+        )
+        conn.execute(text("UPDATE timers SET id = 1 WHERE id <> 1"))
+
+    def _ensure_time_span_schema(conn) -> None:
+        if "duration_seconds" not in _get_columns(conn, "time_spans"):
+            conn.execute(text("ALTER TABLE time_spans ADD COLUMN duration_seconds INTEGER"))
+
+        # Backfill closed spans written before the column existed.
+        conn.execute(
+            text(
+                "UPDATE time_spans SET duration_seconds = "
+                "CAST(ROUND((julianday(end_timestamp) - julianday(start_timestamp)) * 86400) AS INTEGER) "
+                "WHERE end_timestamp IS NOT NULL AND duration_seconds IS NULL"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_time_spans_log_entry_duration ON time_spans (log_entry_id, duration_seconds)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_time_spans_log_entry_start ON time_spans (log_entry_id, start_timestamp)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_time_spans_open ON time_spans (created_at) "
+                "WHERE end_timestamp IS NULL"
+            )
+        )
+        # Redundant with the composite indexes, which lead with log_entry_id.
+        conn.execute(text("DROP INDEX IF EXISTS ix_time_spans_log_entry_id"))
+
+    def _ensure_category_codes(conn, table_name: str) -> None:
+        # Category used to be stored as the enum member name (VARCHAR); it is
+        # now a SMALLINT code (models.CATEGORY_CODES). SQLite cannot change a
+        # column's type or constraints in place, so the table is rebuilt
+        # (https://sqlite.org/lang_altertable.html#otheralter): create it
+        # from the model under a temporary name, copy the rows over, drop the
+        # old table, rename, then recreate the model's indexes. foreign_keys
+        # is never enabled by this app, so dropping a referenced table is safe.
+        from sqlalchemy.schema import CreateTable
+
+        from models import CATEGORY_CODES
+
+        table = Base.metadata.tables[table_name]
+        rows = conn.execute(text(f"PRAGMA table_info({table_name})")).mappings().all()
+        declared = {str(r["name"]): (str(r["type"]).upper(), bool(r["notnull"])) for r in rows}
+        # Earlier upgrades added the code column with ALTER TABLE, which
+        # leaves it nullable; those tables are rebuilt as well.
+        if declared.get("category") == ("SMALLINT", not table.c.category.nullable):
             return
 
+        new_name = f"_{table_name}_new"
+        create_sql = str(CreateTable(table).compile(conn)).replace(
+            f"CREATE TABLE {table_name} ", f"CREATE TABLE {new_name} ", 1
+        )
+        conn.execute(text(f"DROP TABLE IF EXISTS {new_name}"))
+        conn.execute(text(create_sql))
+
+        # Member names map to their codes; anything else is a code already
+        # written as text by an earlier in-place upgrade.
+        case_sql = "CASE category " + " ".join(
+            f"WHEN '{category.name}' THEN {code}"
+            for category, code in CATEGORY_CODES.items()
+        ) + " ELSE CAST(category AS INTEGER) END"
+        columns = [column.name for column in table.columns if column.name in declared]
+        select_sql = ", ".join(
+            case_sql if name == "category" else name for name in columns
+        )
+        conn.execute(
+            text(
+                f"INSERT INTO {new_name} ({', '.join(columns)}) "
+                f"SELECT {select_sql} FROM {table_name}"
+            )
+        )
+        conn.execute(text(f"DROP TABLE {table_name}"))
+        conn.execute(text(f"ALTER TABLE {new_name} RENAME TO {table_name}"))
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+    def _ensure_log_entry_schema(conn) -> None:
         cols = _get_columns(conn, "log_entries")
 
         if "uuid" not in cols:
@@ -54,15 +250,19 @@ def ensure_schema(engine):
         if "previous_task_uuid" not in cols:
             conn.execute(text("ALTER TABLE log_entries ADD COLUMN previous_task_uuid TEXT"))
 
-        # Backfill UUIDs for existing rows.
-        missing = conn.execute(
-            text("SELECT id FROM log_entries WHERE uuid IS NULL OR uuid = ''")
-        ).fetchall()
-        for (row_id,) in missing:
-            conn.execute(
-                text("UPDATE log_entries SET uuid = :uuid WHERE id = :id"),
-                {"uuid": str(uuidlib.uuid4()), "id": row_id},
+        # Backfill UUIDs (v4, generated by SQLite) for existing rows in one statement.
+        conn.execute(
+            text(
+                "UPDATE log_entries SET uuid = "
+                "lower(hex(randomblob(4))) || '-' || lower(hex(randomblob(2))) || '-4' || "
+                "substr(lower(hex(randomblob(2))), 2) || '-' || "
+                "substr('89ab', 1 + (abs(random()) % 4), 1) || "
+                "substr(lower(hex(randomblob(2))), 2) || '-' || lower(hex(randomblob(6))) "
+                "WHERE uuid IS NULL OR uuid = ''"
             )
+        )
+        # After the uuid backfill: the rebuilt table declares uuid NOT NULL.
+        _ensure_category_codes(conn, "log_entries")
 
         # Create indexes (unique where possible).
         conn.execute(
@@ -75,11 +275,56 @@ def ensure_schema(engine):
                 "CREATE INDEX IF NOT EXISTS ix_log_entries_previous_task_uuid ON log_entries (previous_task_uuid)"
             )
         )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_log_entries_date_category ON log_entries (date, category)"
+            )
+        )
+        # Redundant with ix_log_entries_date_category, which leads with date.
+        conn.execute(text("DROP INDEX IF EXISTS ix_log_entries_date"))
+
+    global _project_fts_enabled
+
+    with engine.begin() as conn:
+        # Up-to-date databases are stamped with SCHEMA_VERSION; skip the checks.
+        if conn.execute(text("PRAGMA user_version")).scalar() == SCHEMA_VERSION:
+            _project_fts_enabled = _has_table(conn, "projects_fts")
+            return
+
+        Base.metadata.create_all(bind=conn)
+        if _has_table(conn, "projects"):
+            _project_fts_enabled = _ensure_project_fts(conn)
+        if _has_table(conn, "time_spans"):
+            _ensure_time_span_schema(conn)
+        if _has_table(conn, "timers"):
+            _ensure_timer_singleton(conn)
+            _ensure_category_codes(conn, "timers")
+        if _has_table(conn, "log_entries"):
+            _ensure_log_entry_schema(conn)
 
+        conn.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
 
-def get_db():
+
+def _get_db_sync():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def _get_db_async():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+# A sync generator dependency costs two threadpool hops per request (enter
+# and exit); an async one runs on the event loop, so its close() must not
+# block. Creating a Session does no I/O, but close() rolls back and returns
+# the connection to the pool. Against SQLite that is a local library call;
+# against a networked database the ROLLBACK is a server round trip, so the
+# session is closed in the threadpool instead.
+get_db = _get_db_async if DATABASE_URL.startswith("sqlite") else _get_db_sync
@@ -4,10 +4,11 @@ import os
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from db import Base, engine, ensure_schema
+from db import engine, ensure_schema
 from routes.logs import router as logs_router
 from routes.projects import router as projects_router
 from routes.reports import router as reports_router
@@ -17,7 +18,6 @@ from routes.timespans import router as timespans_router
 
 
 def create_app() -> FastAPI:
-    Base.metadata.create_all(bind=engine)
     ensure_schema(engine)
 
     app = FastAPI(title="Open Worklog API", openapi_url="/api/v1/openapi.json")
@@ -33,6 +33,9 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Report exports repeat the same project names, categories and
+    # timestamps; gzip shrinks them several-fold. Small payloads are sent as-is.
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
 
     app.include_router(logs_router, prefix="/api/v1")
     app.include_router(stats_router, prefix="/api/v1")
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
+from bisect import bisect_right
 from datetime import date
 from enum import Enum
+from itertools import accumulate
 from typing import Any, cast
 
 import httpx
@@ -15,6 +18,15 @@ from pydantic import BaseModel, ConfigDict, Field
 logger = logging.getLogger(__name__)
 
 API_BASE_URL = os.getenv("OPEN_WORKLOG_API_BASE_URL", "http://localhost:8000/api/v1")
+# Build reports with crud directly against the backend database instead of
+# calling the HTTP API (for deployments where both share the database).
+IN_PROCESS = os.getenv("OPEN_WORKLOG_INPROCESS", "").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "y",
+    "on",
+}
 CHARACTER_LIMIT = 25_000
 DEFAULT_TIMEOUT = httpx.Timeout(20.0, connect=5.0)
 
@@ -75,12 +87,66 @@ class WeeklyReportInput(BaseModel):
     )
 
 
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use.
+
+    Reusing one client keeps connections to the backend alive across tool
+    calls. It lives for the whole stdio session; main() closes it on exit.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            base_url=f"{API_BASE_URL.rstrip('/')}/",
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def _close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _build_report_in_process(path: str, params: dict[str, Any]) -> dict[str, Any]:
+    # Imported lazily so the HTTP mode never opens the backend database.
+    import crud
+    from db import SessionLocal
+
+    # The report caches are only invalidated by commits in this process, but
+    # here the API server is the writer, so always build from the database.
+    with SessionLocal() as db:
+        if path == "/reports/daily":
+            report = crud.build_daily_report(
+                db, date.fromisoformat(params["date"]), use_cache=False
+            )
+        elif path == "/reports/weekly":
+            report = crud.build_weekly_report(
+                db,
+                date.fromisoformat(params["week_start"]),
+                author=params.get("author"),
+                summary_qualitative=params.get("summary_qualitative"),
+                summary_quantitative=params.get("summary_quantitative"),
+                next_week_plan=params.get("next_week_plan"),
+                use_cache=False,
+            )
+        else:
+            raise ValueError(f"Unsupported report path: {path}")
+    # Same JSON-compatible shape the HTTP API returns.
+    return report.model_dump(mode="json")
+
+
 async def _fetch_report(path: str, params: dict[str, Any]) -> dict[str, Any]:
-    url = f"{API_BASE_URL.rstrip('/')}{path}"
-    async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    if IN_PROCESS:
+        return await asyncio.to_thread(_build_report_in_process, path, params)
+    response = await _get_http_client().get(path.lstrip("/"), params=params)
+    response.raise_for_status()
+    return response.json()
 
 
 def _format_error_message(exc: Exception) -> str:
@@ -112,25 +178,41 @@ def _truncate_text(value: str) -> str:
     return value[: CHARACTER_LIMIT - len(suffix)] + suffix
 
 
+def _json_list_length(prefix_sizes: list[int], count: int) -> int:
+    """Length of json.dumps() of the first `count` items, given prefix sums of
+    the items' own serialized lengths ("[a, b]": brackets plus ", " between)."""
+    if count == 0:
+        return 2
+    return 2 + prefix_sizes[count] + 2 * (count - 1)
+
+
+def _prefix_sizes(items: list[Any]) -> list[int]:
+    sizes = (len(json.dumps(item, default=str)) for item in items)
+    return list(accumulate(sizes, initial=0))
+
+
 def _truncate_daily_report(report: dict[str, Any]) -> dict[str, Any]:
     entries = list(report.get("entries") or [])
     original_count = len(entries)
     if not entries:
         return report
 
-    serialized = json.dumps(report, default=str)
-    if len(serialized) <= CHARACTER_LIMIT:
+    serialized_length = len(json.dumps(report, default=str))
+    if serialized_length <= CHARACTER_LIMIT:
         return report
 
-    truncated_entries = entries
-    while len(truncated_entries) > 1:
-        truncated_entries = truncated_entries[: max(1, len(truncated_entries) // 2)]
-        report["entries"] = truncated_entries
-        if len(json.dumps(report, default=str)) <= CHARACTER_LIMIT:
-            break
+    # Serialize each entry once, then binary-search the longest prefix of
+    # entries that fits (always keeping at least one).
+    prefix_sizes = _prefix_sizes(entries)
+    other_length = serialized_length - _json_list_length(prefix_sizes, original_count)
+    list_lengths = [
+        _json_list_length(prefix_sizes, count) for count in range(1, original_count + 1)
+    ]
+    kept = max(1, bisect_right(list_lengths, CHARACTER_LIMIT - other_length))
+    report["entries"] = entries[:kept]
 
     report["truncated"] = True
-    report["truncated_count"] = original_count - len(truncated_entries)
+    report["truncated_count"] = original_count - kept
     report["truncation_message"] = (
         "Report truncated to fit size limits. "
         "Consider narrowing the report scope if fewer entries are needed."
@@ -140,29 +222,36 @@ def _truncate_daily_report(report: dict[str, Any]) -> dict[str, Any]:
 
 def _truncate_weekly_report(report: dict[str, Any]) -> dict[str, Any]:
     categories = report.get("categories") or {}
-    serialized = json.dumps(report, default=str)
-    if len(serialized) <= CHARACTER_LIMIT:
+    serialized_length = len(json.dumps(report, default=str))
+    if serialized_length <= CHARACTER_LIMIT:
         return report
 
     category_keys = ["routine_work", "okr", "team_contribution", "company_contribution"]
     truncation_counts: dict[str, int] = {key: 0 for key in category_keys}
+    entries_by_key = {key: list(categories.get(key) or []) for key in category_keys}
+    # Serialize each entry once and track the report length arithmetically.
+    prefix_sizes = {key: _prefix_sizes(entries_by_key[key]) for key in category_keys}
+    kept = {key: len(entries_by_key[key]) for key in category_keys}
 
-    while len(serialized) > CHARACTER_LIMIT:
+    while serialized_length > CHARACTER_LIMIT:
         reduced_any = False
         for key in category_keys:
-            entries = list(categories.get(key) or [])
-            if len(entries) <= 1:
+            count = kept[key]
+            if count <= 1:
                 continue
-            new_entries = entries[: max(1, len(entries) // 2)]
-            truncation_counts[key] += len(entries) - len(new_entries)
-            categories[key] = new_entries
+            new_count = max(1, count // 2)
+            truncation_counts[key] += count - new_count
+            serialized_length -= _json_list_length(
+                prefix_sizes[key], count
+            ) - _json_list_length(prefix_sizes[key], new_count)
+            kept[key] = new_count
+            categories[key] = entries_by_key[key][:new_count]
             reduced_any = True
 
-        report["categories"] = categories
-        serialized = json.dumps(report, default=str)
         if not reduced_any:
             break
 
+    report["categories"] = categories
     report["truncated"] = True
     report["truncation_message"] = (
         "Weekly report truncated to fit size limits. "
@@ -184,29 +273,31 @@ def _format_totals(totals: dict[str, Any] | None) -> str:
     return "\n".join(lines)
 
 
+_ENTRY_HEAD = "- {}: {}\n  - Hours: {:.2f} (+{:.2f} additional)"
+# Optional per-entry fields, in display order, with their line prefix.
+_ENTRY_DETAILS = (
+    ("category", "\n  - Category: "),
+    ("status", "\n  - Status: "),
+    ("notes", "\n  - Notes: "),
+    ("uuid", "\n  - UUID: "),
+)
+
+
 def _format_entry(entry: dict[str, Any]) -> str:
     project_name = entry.get("project_name") or f"Project {entry.get('project_id')}"
-    task = entry.get("task", "")
-    hours = entry.get("hours", 0)
-    additional_hours = entry.get("additional_hours", 0)
-    category = entry.get("category")
-    status = entry.get("status")
-    notes = entry.get("notes")
-    uuid = entry.get("uuid")
-
-    lines = [f"- {project_name}: {task}"]
-    lines.append(
-        f"  - Hours: {float(hours):.2f} (+{float(additional_hours):.2f} additional)"
-    )
-    if category:
-        lines.append(f"  - Category: {category}")
-    if status:
-        lines.append(f"  - Status: {status}")
-    if notes:
-        lines.append(f"  - Notes: {notes}")
-    if uuid:
-        lines.append(f"  - UUID: {uuid}")
-    return "\n".join(lines)
+    parts = [
+        _ENTRY_HEAD.format(
+            project_name,
+            entry.get("task", ""),
+            float(entry.get("hours", 0)),
+            float(entry.get("additional_hours", 0)),
+        )
+    ]
+    for key, prefix in _ENTRY_DETAILS:
+        value = entry.get(key)
+        if value:
+            parts.append(f"{prefix}{value}")
+    return "".join(parts)
 
 
 def _render_daily_markdown(report: dict[str, Any]) -> str:
@@ -226,6 +317,15 @@ def _render_daily_markdown(report: dict[str, Any]) -> str:
     return "\n\n".join([title, totals, "## Entries", entries_block]) + extra
 
 
+# WeeklyReport.categories keys and their pre-formatted section headers.
+_WEEKLY_CATEGORY_SECTIONS = (
+    ("routine_work", "\n## Routine Work"),
+    ("okr", "\n## OKR"),
+    ("team_contribution", "\n## Team Contribution"),
+    ("company_contribution", "\n## Company Contribution"),
+)
+
+
 def _render_weekly_markdown(report: dict[str, Any]) -> str:
     title = f"# Weekly Report ({report.get('week_id', '')})"
     date_range = f"{report.get('week_start', '')} → {report.get('week_end', '')}"
@@ -254,15 +354,9 @@ def _render_weekly_markdown(report: dict[str, Any]) -> str:
         lines.append(totals)
 
     categories = report.get("categories") or {}
-    category_map = {
-        "routine_work": "Routine Work",
-        "okr": "OKR",
-        "team_contribution": "Team Contribution",
-        "company_contribution": "Company Contribution",
-    }
-    for key, label in category_map.items():
+    for key, header in _WEEKLY_CATEGORY_SECTIONS:
         entries = categories.get(key) or []
-        lines.append(f"\n## {label}")
+        lines.append(header)
         if entries:
             lines.append("\n".join(_format_entry(entry) for entry in entries))
         else:
@@ -363,9 +457,23 @@ async def open_worklog_get_weekly_report(params: WeeklyReportInput) -> CallToolR
     return _build_result(report, markdown, params.response_format)
 
 
+async def _serve() -> None:
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await _close_http_client()
+
+
 def main() -> None:
     logging.basicConfig(level=logging.INFO)
-    mcp.run(transport="stdio")
+    if IN_PROCESS:
+        # Same startup step as the API: create/upgrade the schema before the
+        # first report query, in case this process opens the database first.
+        import models  # noqa: F401  (registers the tables on Base.metadata)
+        from db import engine, ensure_schema
+
+        ensure_schema(engine)
+    asyncio.run(_serve())
 
 
 if __name__ == "__main__":
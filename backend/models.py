@@ -2,13 +2,14 @@ from datetime import date, datetime, timezone
 from enum import Enum
 import uuid as uuidlib
 
-from sqlalchemy import Column, Date, DateTime, Enum as SqlEnum, Float, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import CheckConstraint, Column, Date, DateTime, Enum as SqlEnum, Float, ForeignKey, Index, Integer, SmallInteger, String, Text, event, select, text
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import column_property, relationship
 
 from db import Base
 
 
-def utc_now():
+def utc_now() -> datetime:
     """Return current UTC time as naive datetime for database storage.
     SQLAlchemy DateTime columns store as naive UTC datetime objects.
     """
@@ -26,6 +27,41 @@ class Category(str, Enum):
     COMPANY = "Company Contribution"
 
 
+# Stored codes for Category. Append new members; never renumber.
+CATEGORY_CODES: dict[Category, int] = {
+    Category.ROUTINE: 1,
+    Category.OKR: 2,
+    Category.TEAM: 3,
+    Category.COMPANY: 4,
+}
+CATEGORY_BY_CODE: dict[int, Category] = {code: c for c, code in CATEGORY_CODES.items()}
+
+
+class CategoryType(TypeDecorator):
+    """Persist Category as a SMALLINT code (see CATEGORY_CODES).
+
+    Integer keys keep the (date, category) index and the get_stats GROUP BY
+    small; the ORM still sees Category members.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return CATEGORY_CODES[Category(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return CATEGORY_BY_CODE[int(value)]
+
+
+# The timers table holds at most one row (the single active timer).
+TIMER_SINGLETON_ID = 1
+
+
 class TimerStatus(str, Enum):
     RUNNING = "running"
     PAUSED = "paused"
@@ -43,14 +79,19 @@ class Project(Base):
 
 class LogEntry(Base):
     __tablename__ = "log_entries"
+    __table_args__ = (
+        # get_stats: date range filter + GROUP BY (date, category).
+        Index("ix_log_entries_date_category", "date", "category"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     # Stable identifier (useful for duplication lineage and external references)
     uuid = Column(String(36), nullable=False, default=generate_uuid, unique=True, index=True)
     # UUID of the source entry this entry was duplicated from (if any)
     previous_task_uuid = Column(String(36), nullable=True, index=True)
-    date = Column(Date, nullable=False, index=True)
-    category = Column(SqlEnum(Category), nullable=False)
+    # Indexed through ix_log_entries_date_category, which leads with date.
+    date = Column(Date, nullable=False)
+    category = Column(CategoryType(), nullable=False)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
     task = Column(Text, nullable=False)
     hours = Column(Float, nullable=False)  # Total hours = TimeSpan hours + additional_hours
@@ -59,32 +100,78 @@ class LogEntry(Base):
     notes = Column(Text, nullable=True)
     timespans = relationship("TimeSpan", back_populates="log_entry", cascade="all, delete-orphan")
     project_rel = relationship("Project", back_populates="log_entries")
-
-    @property
-    def project_name(self) -> str | None:
-        """Get project name from relationship for API responses."""
-        return self.project_rel.name if self.project_rel else None
+    # Every API response for an entry includes project_name; selecting it as
+    # a correlated scalar subquery keeps it in the entry row itself, so
+    # serialization never touches project_rel.
+    project_name = column_property(
+        select(Project.name)
+        .where(Project.id == project_id)
+        .correlate_except(Project)
+        .scalar_subquery()
+    )
 
 
 class TimeSpan(Base):
     __tablename__ = "time_spans"
+    __table_args__ = (
+        # Covers SUM(duration_seconds) per entry without touching the table.
+        Index("ix_time_spans_log_entry_duration", "log_entry_id", "duration_seconds"),
+        # Per-entry reads ordered by start (get_timespans_for_entry, merges).
+        Index("ix_time_spans_log_entry_start", "log_entry_id", "start_timestamp"),
+        # get_active_timespan: the few open spans, newest first.
+        Index(
+            "ix_time_spans_open",
+            "created_at",
+            sqlite_where=text("end_timestamp IS NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    log_entry_id = Column(Integer, ForeignKey("log_entries.id"), nullable=False, index=True)
+    # Indexed by the composite indexes above (log_entry_id is their prefix).
+    log_entry_id = Column(Integer, ForeignKey("log_entries.id"), nullable=False)
     start_timestamp = Column(DateTime, nullable=False)
     end_timestamp = Column(DateTime, nullable=True)
+    # Denormalized end - start in whole seconds; NULL while the span is open.
+    # Maintained by the before_insert/before_update listeners below.
+    duration_seconds = Column(Integer, nullable=True)
     created_at = Column(DateTime, nullable=False, default=utc_now)
     log_entry = relationship("LogEntry", back_populates="timespans")
 
 
+def span_duration_seconds(
+    start_timestamp: datetime, end_timestamp: datetime | None
+) -> int | None:
+    """Return the span duration in whole seconds, or None for open spans."""
+    if end_timestamp is None:
+        return None
+    return int(round((end_timestamp - start_timestamp).total_seconds()))
+
+
+@event.listens_for(TimeSpan, "before_insert")
+@event.listens_for(TimeSpan, "before_update")
+def _sync_duration_seconds(mapper, connection, target: TimeSpan) -> None:
+    target.duration_seconds = span_duration_seconds(
+        target.start_timestamp, target.end_timestamp
+    )
+
+
 class Timer(Base):
     __tablename__ = "timers"
-
-    id = Column(Integer, primary_key=True, index=True)
+    __table_args__ = (
+        CheckConstraint(f"id = {TIMER_SINGLETON_ID}", name="ck_timers_singleton"),
+    )
+
+    id = Column(
+        Integer,
+        primary_key=True,
+        index=True,
+        autoincrement=False,
+        default=TIMER_SINGLETON_ID,
+    )
     log_entry_id = Column(Integer, ForeignKey("log_entries.id"), nullable=True, index=True)
     started_at = Column(DateTime, nullable=False)
     status = Column(SqlEnum(TimerStatus), nullable=False)
     date = Column(Date, nullable=True)
-    category = Column(SqlEnum(Category), nullable=True)
+    category = Column(CategoryType(), nullable=True)
     project_id = Column(Integer, ForeignKey("projects.id"), nullable=True)
     task = Column(Text, nullable=True)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, TypeVar
+
+from fastapi import Header, HTTPException
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Replays are kept for an hour, like a typical client retry window.
+IDEMPOTENCY_TTL_SECONDS = 3600
+_MAX_ENTRIES = 1024
+
+_lock = threading.Lock()
+# (scope, key) -> (expires_at, request fingerprint, response model); oldest first.
+_responses: OrderedDict[
+    tuple[str, str], tuple[float, Optional[bytes], BaseModel]
+] = OrderedDict()
+# (scope, key) -> [lock, number of requests holding or waiting on it]. An
+# entry lives only while a request with that key is in flight.
+_key_locks: dict[tuple[str, str], list] = {}
+
+
+def idempotency_key(
+    key: Optional[str] = Header(None, alias="Idempotency-Key"),
+) -> Optional[str]:
+    """Optional Idempotency-Key request header."""
+    return key or None
+
+
+def _fingerprint(body: Optional[BaseModel]) -> Optional[bytes]:
+    if body is None:
+        return None
+    return hashlib.blake2b(body.model_dump_json().encode(), digest_size=16).digest()
+
+
+def _lookup(
+    cache_key: tuple[str, str], fingerprint: Optional[bytes], now: float
+) -> Optional[BaseModel]:
+    cached = _responses.get(cache_key)
+    if cached is None:
+        return None
+    expires_at, cached_fingerprint, response = cached
+    if expires_at <= now:
+        del _responses[cache_key]
+        return None
+    if cached_fingerprint != fingerprint:
+        raise HTTPException(
+            status_code=422,
+            detail="Idempotency-Key was already used with a different request body",
+        )
+    return response
+
+
+def _release_key_lock(cache_key: tuple[str, str]) -> None:
+    with _lock:
+        entry = _key_locks[cache_key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _key_locks[cache_key]
+
+
+def run_idempotent(
+    key: Optional[str],
+    scope: str,
+    model: type[ModelT],
+    handler: Callable[[], Any],
+    body: Optional[BaseModel] = None,
+) -> Any:
+    """Run handler once per (scope, Idempotency-Key) and replay its response.
+
+    A retried request carrying the same key gets the first successful
+    response back without touching the database again. The request body is
+    fingerprinted with the response, and reusing a key with a different body
+    is rejected with 422. Requests without a key, and handlers that raise,
+    are not recorded. The store is in-process, so replays only cover retries
+    that reach the same worker.
+    """
+    if key is None:
+        return handler()
+
+    cache_key = (scope, key)
+    fingerprint = _fingerprint(body)
+    with _lock:
+        cached = _lookup(cache_key, fingerprint, time.monotonic())
+        if cached is not None:
+            return cached
+        entry = _key_locks.setdefault(cache_key, [threading.Lock(), 0])
+        entry[1] += 1
+
+    # Serialize concurrent retries of one key so only the first one writes.
+    try:
+        with entry[0]:
+            with _lock:
+                cached = _lookup(cache_key, fingerprint, time.monotonic())
+            if cached is not None:
+                return cached
+
+            response = model.model_validate(handler())
+            with _lock:
+                _responses[cache_key] = (
+                    time.monotonic() + IDEMPOTENCY_TTL_SECONDS,
+                    fingerprint,
+                    response,
+                )
+                _responses.move_to_end(cache_key)
+                while len(_responses) > _MAX_ENTRIES:
+                    _responses.popitem(last=False)
+            return response
+    finally:
+        _release_key_lock(cache_key)
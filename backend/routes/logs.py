@@ -1,20 +1,31 @@
 from __future__ import annotations
 
 from datetime import date
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 import crud
 import schemas
 from db import get_db
+from routes.idempotency import idempotency_key, run_idempotent
+from routes.responses import json_response
 
 router = APIRouter()
 
+_LOG_LIST_ADAPTER = TypeAdapter(list[schemas.LogEntryRead])
+
 
 @router.get("/logs/{log_date}", response_model=list[schemas.LogEntryRead])
-def get_logs_for_date(log_date: date, db: Session = Depends(get_db)):
-    return crud.get_logs_by_date(db, log_date)
+def get_logs_for_date(
+    log_date: date, request: Request, db: Session = Depends(get_db)
+):
+    entries = _LOG_LIST_ADAPTER.validate_python(
+        crud.get_logs_by_date(db, log_date), from_attributes=True
+    )
+    return json_response(_LOG_LIST_ADAPTER.dump_json(entries), request)
 
 
 @router.get("/logs/uuid/{log_uuid}", response_model=schemas.LogEntryRead)
@@ -26,8 +37,21 @@ def get_log_by_uuid(log_uuid: str, db: Session = Depends(get_db)):
 
 
 @router.post("/logs", response_model=schemas.LogEntryRead)
-def create_log(log: schemas.LogEntryCreate, db: Session = Depends(get_db)):
-    return crud.create_log(db, log)
+def create_log(
+    log: schemas.LogEntryCreate,
+    db: Session = Depends(get_db),
+    key: Optional[str] = Depends(idempotency_key),
+):
+    return run_idempotent(
+        key, "logs", schemas.LogEntryRead, lambda: crud.create_log(db, log), log
+    )
+
+
+@router.post("/logs/batch", response_model=list[schemas.LogEntryRead])
+def create_logs_batch(
+    logs: list[schemas.LogEntryCreate], db: Session = Depends(get_db)
+):
+    return crud.create_logs_batch(db, logs)
 
 
 @router.put("/logs/{log_id}", response_model=schemas.LogEntryRead)
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 import crud
 import schemas
 from db import get_db
+from routes.idempotency import idempotency_key, run_idempotent
 
 router = APIRouter()
 
@@ -21,11 +22,18 @@ def get_projects(
 
 
 @router.post("/projects", response_model=schemas.ProjectRead)
-def create_project(project: schemas.ProjectCreate, db: Session = Depends(get_db)):
-    try:
-        return crud.create_project(db, project)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+def create_project(
+    project: schemas.ProjectCreate,
+    db: Session = Depends(get_db),
+    key: Optional[str] = Depends(idempotency_key),
+):
+    def handler():
+        try:
+            return crud.create_project(db, project)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return run_idempotent(key, "projects", schemas.ProjectRead, handler, project)
 
 
 @router.get("/projects/{project_id}", response_model=schemas.ProjectRead)
@@ -3,33 +3,45 @@ from __future__ import annotations
 from datetime import date
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 import crud
 import schemas
 from db import get_db
+from routes.responses import json_response
 
 router = APIRouter()
 
 
+def _json_attachment(
+    request: Request, report: BaseModel, filename: str
+) -> Response:
+    # model_dump_json() serializes in pydantic-core in one pass, instead of
+    # jsonable_encoder() building a dict that JSONResponse then re-encodes.
+    return json_response(
+        report.model_dump_json(),
+        request,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/reports/daily", response_model=schemas.DailyReport)
 def export_daily_report(
+    request: Request,
     report_date: date = Query(..., alias="date"),
     db: Session = Depends(get_db),
 ):
     report = crud.build_daily_report(db, report_date)
     filename = f"daily-report-{report_date.isoformat()}.json"
-    return JSONResponse(
-        content=jsonable_encoder(report),
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    return _json_attachment(request, report, filename)
 
 
 @router.get("/reports/weekly", response_model=schemas.WeeklyReport)
 def export_weekly_report(
+    request: Request,
     week_start: date = Query(...),
     author: Optional[str] = Query(None),
     summary_qualitative: Optional[str] = Query(None),
@@ -46,8 +58,5 @@ def export_weekly_report(
         next_week_plan=next_week_plan,
     )
     filename = f"weekly-report-{report.week_id}.json"
-    return JSONResponse(
-        content=jsonable_encoder(report),
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    return _json_attachment(request, report, filename)
 
@@ -1,26 +1,39 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 import crud
 import schemas
 from db import get_db
+from routes.idempotency import idempotency_key, run_idempotent
+from routes.responses import json_response, model_json_response
 
 router = APIRouter()
 
 
 @router.post("/timers/start", response_model=schemas.TimerRead)
-def start_timer(request: schemas.TimerStartRequest, db: Session = Depends(get_db)):
-    try:
-        return crud.create_timer(db, request)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+def start_timer(
+    request: schemas.TimerStartRequest,
+    db: Session = Depends(get_db),
+    key: Optional[str] = Depends(idempotency_key),
+):
+    def handler():
+        try:
+            return crud.create_timer(db, request)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return run_idempotent(key, "timers/start", schemas.TimerRead, handler, request)
 
 
-@router.get("/timers/active", response_model=schemas.TimerRead | None)
-def get_active_timer(db: Session = Depends(get_db)):
-    return crud.get_active_timer(db)
+@router.get("/timers/active", response_model=schemas.ActiveTimerRead | None)
+def get_active_timer(request: Request, db: Session = Depends(get_db)):
+    timer = crud.read_active_timer(db)
+    content = timer.model_dump_json() if timer else "null"
+    return json_response(content, request)
 
 
 @router.post("/timers/{timer_id}/pause", response_model=schemas.TimerRead)
@@ -28,7 +41,7 @@ def pause_timer(timer_id: int, db: Session = Depends(get_db)):
     timer = crud.pause_timer(db, timer_id)
     if not timer:
         raise HTTPException(status_code=404, detail="Timer not found")
-    return timer
+    return model_json_response(schemas.TimerRead, timer)
 
 
 @router.post("/timers/{timer_id}/resume", response_model=schemas.TimerRead)
@@ -36,15 +49,24 @@ def resume_timer(timer_id: int, db: Session = Depends(get_db)):
     timer = crud.resume_timer(db, timer_id)
     if not timer:
         raise HTTPException(status_code=404, detail="Timer not found")
-    return timer
+    return model_json_response(schemas.TimerRead, timer)
 
 
 @router.post("/timers/{timer_id}/stop", response_model=schemas.LogEntryRead)
-def stop_timer(timer_id: int, db: Session = Depends(get_db)):
-    entry = crud.stop_timer(db, timer_id)
-    if not entry:
-        raise HTTPException(status_code=404, detail="Timer not found")
-    return entry
+def stop_timer(
+    timer_id: int,
+    db: Session = Depends(get_db),
+    key: Optional[str] = Depends(idempotency_key),
+):
+    def handler():
+        entry = crud.stop_timer(db, timer_id)
+        if not entry:
+            raise HTTPException(status_code=404, detail="Timer not found")
+        return entry
+
+    return run_idempotent(
+        key, f"timers/{timer_id}/stop", schemas.LogEntryRead, handler
+    )
 
 
 @router.delete("/timers/{timer_id}")
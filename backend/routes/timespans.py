@@ -1,20 +1,24 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 import crud
 import models
 import schemas
 from db import get_db
+from routes.responses import json_response, model_json_response
 
 router = APIRouter()
 
+_TIMESPAN_LIST_ADAPTER = TypeAdapter(list[schemas.TimeSpanRead])
+
 
 # Running (open) TimeSpan lifecycle endpoints
 @router.get("/timespans/active", response_model=schemas.TimeSpanRead | None)
 def get_active_timespan(db: Session = Depends(get_db)):
-    return crud.get_active_timespan(db)
+    return crud.read_active_timespan(db)
 
 
 @router.post("/timespans/start", response_model=schemas.TimeSpanRead)
@@ -42,9 +46,10 @@ def start_timespan(request: schemas.TimeSpanStartRequest, db: Session = Depends(
         additional_hours=0.0,
         status="Completed",
     )
+    # Flush (not commit) for the id; start_timespan_for_entry() commits the
+    # entry and its first span together.
     db.add(new_entry)
-    db.commit()
-    db.refresh(new_entry)
+    db.flush()
 
     timespan = crud.start_timespan_for_entry(db, new_entry.id)
     if not timespan:
@@ -57,16 +62,22 @@ def pause_timespan(timespan_id: int, db: Session = Depends(get_db)):
     timespan = crud.end_timespan(db, timespan_id)
     if not timespan:
         raise HTTPException(status_code=404, detail="TimeSpan not found")
-    return timespan
+    return model_json_response(schemas.TimeSpanRead, timespan)
 
 
 # TimeSpan API endpoints
 @router.get("/logs/{log_id}/timespans", response_model=list[schemas.TimeSpanRead])
-def get_timespans(log_id: int, db: Session = Depends(get_db)):
+def get_timespans(log_id: int, request: Request, db: Session = Depends(get_db)):
     entry = crud.get_log(db, log_id)
     if not entry:
         raise HTTPException(status_code=404, detail="Log entry not found")
-    return crud.get_timespans_for_entry(db, log_id)
+    # Rows -> dicts validate much faster than from_attributes lookups, and
+    # dump_json() encodes in pydantic-core instead of response_model
+    # serialization to Python objects followed by json.dumps.
+    timespans = _TIMESPAN_LIST_ADAPTER.validate_python(
+        [row._asdict() for row in crud.get_timespans_for_entry(db, log_id)]
+    )
+    return json_response(_TIMESPAN_LIST_ADAPTER.dump_json(timespans), request)
 
 
 @router.post("/logs/{log_id}/timespans", response_model=schemas.TimeSpanRead)
@@ -83,6 +94,17 @@ def create_timespan(
     return timespan
 
 
+@router.post("/timespans/batch", response_model=list[schemas.TimeSpanRead])
+def create_timespans_batch(
+    request: list[schemas.TimeSpanBatchItem],
+    db: Session = Depends(get_db),
+):
+    timespans = crud.create_timespans_batch(db, request)
+    if timespans is None:
+        raise HTTPException(status_code=404, detail="Log entry not found")
+    return timespans
+
+
 @router.post("/timespans/{timespan_id}/adjust", response_model=schemas.TimeSpanRead)
 def adjust_timespan(
     timespan_id: int,
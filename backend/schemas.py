@@ -1,11 +1,28 @@
 from datetime import date, datetime, timezone
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
 from models import Category, TimerStatus
 
 
+# Shared by the *Read schemas, which are built from ORM objects and rows.
+ORM_MODEL_CONFIG = ConfigDict(from_attributes=True)
+
+
+def serialize_utc_datetime(dt: Optional[datetime]) -> Optional[str]:
+    """Serialize datetime as ISO 8601 with UTC timezone indicator (Z).
+
+    Naive values are stored UTC (see models.utc_now), so the suffix is
+    appended directly instead of attaching tzinfo and rewriting "+00:00".
+    """
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        return dt.isoformat() + 'Z'
+    return dt.isoformat().replace('+00:00', 'Z')
+
+
 class ProjectBase(BaseModel):
     name: str = Field(..., max_length=200)
     description: Optional[str] = None
@@ -19,18 +36,9 @@ class ProjectRead(ProjectBase):
     id: int
     created_at: datetime
 
-    @field_serializer('created_at')
-    def serialize_datetime(self, dt: datetime, _info):
-        """Serialize datetime as ISO 8601 with UTC timezone indicator (Z)."""
-        if dt is None:
-            return None
-        # Ensure timezone-aware and serialize with Z
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.isoformat().replace('+00:00', 'Z')
+    serialize_datetime = field_serializer('created_at')(serialize_utc_datetime)
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_MODEL_CONFIG
 
 
 class LogEntryBase(BaseModel):
@@ -58,8 +66,7 @@ class LogEntryRead(LogEntryBase):
     uuid: str
     project_name: Optional[str] = None  # Populated from relationship
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_MODEL_CONFIG
 
 
 class DailyStat(BaseModel):
@@ -130,18 +137,11 @@ class TimeSpanRead(TimeSpanBase):
     id: int
     created_at: datetime
 
-    @field_serializer('start_timestamp', 'end_timestamp', 'created_at')
-    def serialize_datetime(self, dt: datetime, _info):
-        """Serialize datetime as ISO 8601 with UTC timezone indicator (Z)."""
-        if dt is None:
-            return None
-        # Ensure timezone-aware and serialize with Z
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.isoformat().replace('+00:00', 'Z')
+    serialize_datetime = field_serializer(
+        'start_timestamp', 'end_timestamp', 'created_at'
+    )(serialize_utc_datetime)
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_MODEL_CONFIG
 
 
 class TimeSpanAdjustRequest(BaseModel):
@@ -158,27 +158,14 @@ class TimeSpanUpdate(BaseModel):
         """Parse datetime string, treating timezone-naive strings as UTC.
         All timestamps are stored in the database as naive UTC datetime objects.
         """
-        if v is None:
-            return None
         if isinstance(v, str):
-            # Handle 'Z' suffix (replace with +00:00 for fromisoformat)
-            if v.endswith('Z'):
-                v = v[:-1] + '+00:00'
-            # Parse ISO format
-            dt = datetime.fromisoformat(v)
-            # If timezone-naive, assume UTC
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            # Convert to UTC and make naive for database storage
-            # (SQLAlchemy DateTime columns store as naive UTC)
-            if dt.tzinfo is not None:
-                dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
-            return dt
-        # If already a datetime object, ensure it's naive UTC
-        if isinstance(v, datetime):
-            if v.tzinfo is not None:
-                v = v.astimezone(timezone.utc).replace(tzinfo=None)
-            return v
+            # Python >= 3.11 parses a trailing 'Z' itself.
+            v = datetime.fromisoformat(v)
+        # Naive values are already UTC; aware ones are converted and made
+        # naive for database storage (SQLAlchemy DateTime columns store
+        # naive UTC).
+        if isinstance(v, datetime) and v.tzinfo is not None:
+            return v.astimezone(timezone.utc).replace(tzinfo=None)
         return v
 
 
@@ -187,6 +174,10 @@ class TimeSpanCreateRequest(TimeSpanUpdate):
     end_timestamp: datetime
 
 
+class TimeSpanBatchItem(TimeSpanCreateRequest):
+    log_entry_id: int
+
+
 class TimeSpanStartRequest(BaseModel):
     """Start (or resume) a running session as an open TimeSpan.
 
@@ -212,18 +203,14 @@ class TimerRead(BaseModel):
     project_id: Optional[int] = None
     task: Optional[str] = None
 
-    @field_serializer('started_at')
-    def serialize_datetime(self, dt: datetime, _info):
-        """Serialize datetime as ISO 8601 with UTC timezone indicator (Z)."""
-        if dt is None:
-            return None
-        # Ensure timezone-aware and serialize with Z
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.isoformat().replace('+00:00', 'Z')
-
-    class Config:
-        from_attributes = True
+    serialize_datetime = field_serializer('started_at')(serialize_utc_datetime)
+
+    model_config = ORM_MODEL_CONFIG
+
+
+class ActiveTimerRead(TimerRead):
+    # Closed-span hours of the linked entry (GET /timers/active only).
+    elapsed_hours: Optional[float] = None
 
 
 class TimerStartRequest(BaseModel):
@@ -0,0 +1,66 @@
+import unittest
+from datetime import date, datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import crud
+from db import Base
+from models import Category, LogEntry, Project, TimerStatus
+from schemas import TimerStartRequest
+
+
+class TestActiveSnapshots(unittest.TestCase):
+    """Active timer/timespan snapshots must follow every committed write."""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=self.engine)
+        self.db = sessionmaker(bind=self.engine, autoflush=False)()
+        entry = LogEntry(
+            date=date(2026, 1, 1),
+            category=Category.OKR,
+            project_rel=Project(name="P"),
+            task="t",
+            hours=0.0,
+        )
+        self.db.add(entry)
+        self.db.commit()
+        self.entry_id = entry.id
+        # Snapshots are process-wide; start from a fresh version.
+        crud.bump_active_version()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def test_timespan_snapshot_follows_start_and_pause(self):
+        self.assertIsNone(crud.read_active_timespan(self.db))
+        span = crud.start_timespan_for_entry(
+            self.db, self.entry_id, now=datetime(2026, 1, 1, 9, 0)
+        )
+        self.assertEqual(crud.read_active_timespan(self.db).id, span.id)
+        crud.end_timespan(self.db, span.id, now=datetime(2026, 1, 1, 10, 0))
+        self.assertIsNone(crud.read_active_timespan(self.db))
+
+    def test_timer_snapshot_follows_bulk_writes(self):
+        self.assertIsNone(crud.read_active_timer(self.db))
+        # create_timer writes with an UPDATE/INSERT statement, not a flush.
+        timer = crud.create_timer(
+            self.db,
+            TimerStartRequest(log_entry_id=self.entry_id),
+            now=datetime(2026, 1, 1, 9, 0),
+        )
+        self.assertEqual(crud.read_active_timer(self.db).status, TimerStatus.RUNNING)
+        crud.pause_timer(self.db, timer.id, now=datetime(2026, 1, 1, 9, 30))
+        self.assertEqual(crud.read_active_timer(self.db).status, TimerStatus.PAUSED)
+        crud.delete_timer(self.db, timer.id)
+        self.assertIsNone(crud.read_active_timer(self.db))
+
+    def test_snapshot_is_reused_while_nothing_changes(self):
+        crud.start_timespan_for_entry(self.db, self.entry_id, now=datetime(2026, 1, 1, 9, 0))
+        self.assertIs(crud.read_active_timespan(self.db), crud.read_active_timespan(self.db))
+
+
+if __name__ == "__main__":
+    unittest.main()
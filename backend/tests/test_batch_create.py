@@ -0,0 +1,129 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import crud
+from db import Base
+from models import Category, Project
+from schemas import LogEntryCreate, TimeSpanBatchItem
+
+DAY = date(2026, 2, 3)
+
+
+class TestBatchCreate(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=self.engine)
+        self.db = sessionmaker(bind=self.engine, autoflush=False)()
+        project = Project(name="P")
+        self.db.add(project)
+        self.db.commit()
+        self.project_id = project.id
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _log(self, task: str, additional_hours: float = 0.0) -> LogEntryCreate:
+        return LogEntryCreate(
+            date=DAY,
+            category=Category.OKR,
+            project_id=self.project_id,
+            task=task,
+            hours=0,
+            additional_hours=additional_hours,
+        )
+
+    def test_logs_batch_keeps_request_order_and_rounds_hours(self):
+        tasks = ["c", "a", "b", "e", "d"]
+        entries = crud.create_logs_batch(
+            self.db,
+            [self._log(task, 1.1) for task in tasks[:2]]
+            + [self._log(task, 0.3) for task in tasks[2:]],
+        )
+
+        self.assertEqual([e.task for e in entries], tasks)
+        self.assertEqual([e.hours for e in entries], [1.0, 1.0, 0.25, 0.25, 0.25])
+        self.assertEqual([e.additional_hours for e in entries], [1.0, 1.0, 0.25, 0.25, 0.25])
+        self.assertEqual({e.project_name for e in entries}, {"P"})
+
+    def test_logs_batch_invalidates_stats_and_reports(self):
+        crud.create_logs_batch(self.db, [self._log("first", 1.0)])
+        self.assertEqual(crud.get_stats(self.db, DAY, DAY)[0]["total_hours"], 1.0)
+        self.assertEqual(len(crud.build_daily_report(self.db, DAY).entries), 1)
+
+        crud.create_logs_batch(self.db, [self._log("second", 2.0), self._log("third", 0.5)])
+
+        self.assertEqual(crud.get_stats(self.db, DAY, DAY)[0]["total_hours"], 3.5)
+        report = crud.build_daily_report(self.db, DAY)
+        self.assertEqual([e.task for e in report.entries], ["first", "second", "third"])
+        self.assertEqual(report.totals.total_hours, 3.5)
+
+    def test_timespans_batch_keeps_request_order_and_rounds_spans(self):
+        first, second = crud.create_logs_batch(self.db, [self._log("a"), self._log("b")])
+        t0 = datetime(2026, 2, 3, 9, 0, 0)
+        items = [
+            # Deliberately not in id or time order; no two spans are connectable.
+            TimeSpanBatchItem(
+                log_entry_id=second.id,
+                start_timestamp=t0 + timedelta(hours=4, minutes=2),
+                end_timestamp=t0 + timedelta(hours=5, minutes=7),
+            ),
+            TimeSpanBatchItem(
+                log_entry_id=first.id,
+                start_timestamp=t0,
+                end_timestamp=t0 + timedelta(minutes=20),
+            ),
+            TimeSpanBatchItem(
+                log_entry_id=second.id,
+                start_timestamp=t0 + timedelta(hours=1),
+                end_timestamp=t0 + timedelta(hours=1, minutes=1),
+            ),
+        ]
+
+        spans = crud.create_timespans_batch(self.db, items)
+
+        self.assertEqual(
+            [(s.log_entry_id, s.start_timestamp, s.end_timestamp) for s in spans],
+            [
+                (second.id, t0 + timedelta(hours=4), t0 + timedelta(hours=5)),
+                (first.id, t0, t0 + timedelta(minutes=15)),
+                (second.id, t0 + timedelta(hours=1), t0 + timedelta(hours=1, minutes=15)),
+            ],
+        )
+        self.assertEqual(crud.get_log(self.db, first.id).hours, 0.25)
+        self.assertEqual(crud.get_log(self.db, second.id).hours, 1.25)
+
+    def test_timespans_batch_invalidates_stats_and_reports(self):
+        (entry,) = crud.create_logs_batch(self.db, [self._log("a", 1.0)])
+        self.assertEqual(crud.get_stats(self.db, DAY, DAY)[0]["total_hours"], 1.0)
+        self.assertEqual(crud.build_daily_report(self.db, DAY).totals.total_hours, 1.0)
+
+        t0 = datetime(2026, 2, 3, 9, 0, 0)
+        crud.create_timespans_batch(
+            self.db,
+            [
+                TimeSpanBatchItem(
+                    log_entry_id=entry.id,
+                    start_timestamp=t0,
+                    end_timestamp=t0 + timedelta(hours=2),
+                )
+            ],
+        )
+
+        self.assertEqual(crud.get_stats(self.db, DAY, DAY)[0]["total_hours"], 3.0)
+        self.assertEqual(crud.build_daily_report(self.db, DAY).totals.total_hours, 3.0)
+
+    def test_timespans_batch_rejects_unknown_entry(self):
+        item = TimeSpanBatchItem(
+            log_entry_id=999,
+            start_timestamp=datetime(2026, 2, 3, 9, 0, 0),
+            end_timestamp=datetime(2026, 2, 3, 10, 0, 0),
+        )
+        self.assertIsNone(crud.create_timespans_batch(self.db, [item]))
+
+
+if __name__ == "__main__":
+    unittest.main()
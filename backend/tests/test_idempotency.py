@@ -0,0 +1,73 @@
+import unittest
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from routes import idempotency
+from routes.idempotency import run_idempotent
+
+
+class _Out(BaseModel):
+    value: int
+
+
+class _Body(BaseModel):
+    name: str
+
+
+class TestRunIdempotent(unittest.TestCase):
+    def setUp(self):
+        self.calls = 0
+
+    def _handler(self):
+        self.calls += 1
+        return {"value": self.calls}
+
+    def test_replays_response_for_same_key(self):
+        first = run_idempotent("k-replay", "scope", _Out, self._handler)
+        second = run_idempotent("k-replay", "scope", _Out, self._handler)
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, 1)
+
+    def test_scopes_and_missing_keys_are_not_shared(self):
+        run_idempotent("k-scope", "a", _Out, self._handler)
+        run_idempotent("k-scope", "b", _Out, self._handler)
+        run_idempotent(None, "a", _Out, self._handler)
+        run_idempotent(None, "a", _Out, self._handler)
+        self.assertEqual(self.calls, 4)
+
+    def test_errors_are_not_recorded(self):
+        def failing():
+            self.calls += 1
+            raise HTTPException(status_code=404)
+
+        with self.assertRaises(HTTPException):
+            run_idempotent("k-error", "scope", _Out, failing)
+        run_idempotent("k-error", "scope", _Out, self._handler)
+        self.assertEqual(self.calls, 2)
+
+    def test_key_locks_are_released_after_success_and_failure(self):
+        def failing():
+            raise HTTPException(status_code=400)
+
+        for index in range(5):
+            with self.assertRaises(HTTPException):
+                run_idempotent(f"k-fail-{index}", "scope", _Out, failing)
+        run_idempotent("k-ok", "scope", _Out, self._handler)
+        self.assertFalse(
+            [k for k in idempotency._key_locks if k[1].startswith(("k-fail-", "k-ok"))]
+        )
+
+    def test_same_key_with_different_body_is_rejected(self):
+        first = run_idempotent("k-body", "scope", _Out, self._handler, _Body(name="a"))
+        replay = run_idempotent("k-body", "scope", _Out, self._handler, _Body(name="a"))
+        self.assertEqual(first, replay)
+
+        with self.assertRaises(HTTPException) as ctx:
+            run_idempotent("k-body", "scope", _Out, self._handler, _Body(name="b"))
+        self.assertEqual(ctx.exception.status_code, 422)
+        self.assertEqual(self.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+import crud
+from db import Base
+from schemas import ProjectCreate
+
+
+class TestCreateProject(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=self.engine)
+        self.db = sessionmaker(bind=self.engine, autoflush=False)()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def test_duplicate_name_is_reported_as_already_existing(self):
+        crud.create_project(self.db, ProjectCreate(name="P"))
+        with self.assertRaisesRegex(ValueError, "already exists"):
+            crud.create_project(self.db, ProjectCreate(name="P"))
+
+    def test_other_integrity_errors_are_not_reported_as_duplicates(self):
+        # Bypasses validation to hit the NOT NULL constraint instead.
+        with self.assertRaises(IntegrityError):
+            crud.create_project(self.db, ProjectCreate.model_construct(name=None))
+        self.assertEqual(crud.create_project(self.db, ProjectCreate(name="P")).name, "P")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import crud
+from db import Base
+from models import Category, LogEntry, Project
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAY = date(2026, 1, 7)
+
+# Runs in a separate interpreter, so its commit can't reach this process's
+# session events or report caches.
+_WRITER = textwrap.dedent(
+    """
+    import sys
+    from datetime import date
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from models import Category, LogEntry
+
+    with Session(create_engine(sys.argv[1])) as db:
+        db.add(
+            LogEntry(
+                date=date(2026, 1, 7),
+                category=Category.TEAM,
+                project_id=1,
+                task="from another process",
+                hours=2.0,
+                additional_hours=2.0,
+            )
+        )
+        db.commit()
+    """
+)
+
+
+class TestReportCacheAcrossProcesses(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.url = f"sqlite:///{self.tmpdir.name}/worklog.db"
+        self.engine = create_engine(self.url)
+        Base.metadata.create_all(bind=self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.db.add(
+            LogEntry(
+                date=DAY,
+                category=Category.OKR,
+                project_rel=Project(name="P"),
+                task="local",
+                hours=1.0,
+                additional_hours=1.0,
+            )
+        )
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+        self.tmpdir.cleanup()
+
+    def _write_from_other_process(self):
+        subprocess.run(
+            [sys.executable, "-c", _WRITER, self.url], cwd=BACKEND_DIR, check=True
+        )
+
+    def test_uncached_reports_see_writes_from_another_process(self):
+        # Warm the per-process cache first.
+        self.assertEqual(len(crud.build_daily_report(self.db, DAY).entries), 1)
+
+        self._write_from_other_process()
+
+        daily = crud.build_daily_report(self.db, DAY, use_cache=False)
+        self.assertEqual([e.task for e in daily.entries], ["local", "from another process"])
+        self.assertEqual(daily.totals.total_hours, 3.0)
+
+        weekly = crud.build_weekly_report(self.db, DAY, use_cache=False)
+        self.assertEqual(weekly.totals.total_hours, 3.0)
+        self.assertEqual(len(weekly.categories.team_contribution), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import crud
+import schemas
+from db import Base
+from models import Category, LogEntry, Project, TimeSpan, Timer, TimerStatus
+
+
+class TestResponseLoading(unittest.TestCase):
+    """Response schemas must only read what the crud reads already loaded.
+
+    Objects are detached before validation, so a lazy load triggered by
+    from_attributes conversion raises instead of silently adding a query.
+    """
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=self.engine)
+        self.db = sessionmaker(bind=self.engine, autoflush=False)()
+
+        t0 = datetime(2026, 1, 1, 9, 0, 0)
+        entry = LogEntry(
+            date=date(2026, 1, 1),
+            category=Category.OKR,
+            project_rel=Project(name="P"),
+            task="t",
+            hours=1.0,
+            timespans=[
+                TimeSpan(start_timestamp=t0, end_timestamp=t0 + timedelta(hours=1))
+            ],
+        )
+        self.db.add(entry)
+        self.db.flush()
+        self.db.add(
+            Timer(log_entry_id=entry.id, started_at=t0, status=TimerStatus.RUNNING)
+        )
+        self.db.commit()
+        self.entry_id = entry.id
+        self.span_id = entry.timespans[0].id
+        # Start from an empty identity map so reads can't reuse loaded state.
+        self.db.expunge_all()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _detached(self, value):
+        self.db.expunge_all()
+        return value
+
+    def test_log_entry_reads(self):
+        entries = self._detached(crud.get_logs_by_date(self.db, date(2026, 1, 1)))
+        self.assertEqual(
+            [schemas.LogEntryRead.model_validate(e).project_name for e in entries],
+            ["P"],
+        )
+        entry = self._detached(crud.get_log(self.db, self.entry_id))
+        self.assertEqual(schemas.LogEntryRead.model_validate(entry).project_name, "P")
+
+    def test_timer_and_timespan_reads(self):
+        timer = crud.read_active_timer(self.db)
+        self.assertEqual(timer.elapsed_hours, 1.0)
+        span = self._detached(crud.get_timespan(self.db, self.span_id))
+        self.assertEqual(schemas.TimeSpanRead.model_validate(span).id, self.span_id)
+        active = self._detached(crud.get_active_timespan(self.db))
+        self.assertIsNone(active)
+
+
+if __name__ == "__main__":
+    unittest.main()
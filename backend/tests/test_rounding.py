@@ -0,0 +1,127 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from crud import (
+    calculate_total_hours,
+    normalize_span,
+    quantize_hours,
+    recalculate_entry_hours,
+    round_to_quarter_hour,
+)
+from db import Base
+from models import Category, LogEntry, Project, TimeSpan
+
+
+class TestQuarterHourRounding(unittest.TestCase):
+    def test_rounds_to_nearest_quarter(self):
+        t0 = datetime(2026, 1, 1, 10, 0, 0)
+        self.assertEqual(round_to_quarter_hour(t0 + timedelta(minutes=7)), t0)
+        self.assertEqual(
+            round_to_quarter_hour(t0 + timedelta(minutes=8)),
+            t0 + timedelta(minutes=15),
+        )
+
+    def test_includes_seconds_and_microseconds(self):
+        t0 = datetime(2026, 1, 1, 10, 0, 0)
+        self.assertEqual(
+            round_to_quarter_hour(t0 + timedelta(minutes=7, seconds=30, microseconds=1)),
+            t0 + timedelta(minutes=15),
+        )
+
+    def test_exact_ties_round_half_to_even(self):
+        t0 = datetime(2026, 1, 1, 10, 0, 0)
+        # 10:07:30 is 40.5 quarters past midnight -> 40 (10:00)
+        self.assertEqual(round_to_quarter_hour(t0 + timedelta(minutes=7, seconds=30)), t0)
+        # 10:22:30 is 41.5 quarters past midnight -> 42 (10:30)
+        self.assertEqual(
+            round_to_quarter_hour(t0 + timedelta(minutes=22, seconds=30)),
+            t0 + timedelta(minutes=30),
+        )
+
+    def test_day_rollover(self):
+        dt = datetime(2026, 1, 1, 23, 59, 50)
+        self.assertEqual(round_to_quarter_hour(dt), datetime(2026, 1, 2, 0, 0, 0))
+
+    def test_normalize_span_enforces_min_duration(self):
+        t0 = datetime(2026, 1, 1, 10, 0, 0)
+        start, end = normalize_span(t0, t0 + timedelta(minutes=3))
+        self.assertEqual(start, t0)
+        self.assertEqual(end, t0 + timedelta(minutes=15))
+
+    def test_normalize_span_keeps_open_end(self):
+        t0 = datetime(2026, 1, 1, 10, 2, 0)
+        start, end = normalize_span(t0, None)
+        self.assertEqual(start, datetime(2026, 1, 1, 10, 0, 0))
+        self.assertIsNone(end)
+
+    def test_quantize_hours(self):
+        self.assertEqual(quantize_hours(1.1), 1.0)
+        self.assertEqual(quantize_hours(1.2), 1.25)
+        # 0.125h is exactly half a quarter -> even (0 quarters)
+        self.assertEqual(quantize_hours(0.125), 0.0)
+        self.assertEqual(quantize_hours(0.375), 0.5)
+
+
+class TestRecalculateEntryHours(unittest.TestCase):
+    """The SQL recalculation must round exactly like calculate_total_hours()."""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=self.engine)
+        self.db = sessionmaker(bind=self.engine, autoflush=False)()
+        self.project = Project(name="P")
+        self.db.add(self.project)
+        self.db.flush()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _recalculated(self, additional_hours, span_minutes):
+        entry = LogEntry(
+            date=date(2026, 1, 1),
+            category=Category.OKR,
+            project_id=self.project.id,
+            task="t",
+            hours=0.0,
+            additional_hours=additional_hours,
+        )
+        self.db.add(entry)
+        self.db.flush()
+        t0 = datetime(2026, 1, 1, 9, 0, 0)
+        for index, minutes in enumerate(span_minutes):
+            start = t0 + timedelta(hours=2 * index)
+            self.db.add(
+                TimeSpan(
+                    log_entry_id=entry.id,
+                    start_timestamp=start,
+                    end_timestamp=start + timedelta(minutes=minutes),
+                )
+            )
+        self.db.flush()
+        recalculate_entry_hours(self.db, entry.id)
+        expected = calculate_total_hours(self.db, entry.id, additional_hours)
+        return self.db.get(LogEntry, entry.id).hours, expected
+
+    def test_ties_round_half_to_even_like_python(self):
+        # 0.25h of spans + 0.125h additional: the additional part rounds to 0
+        # on its own, so the total is 0.25 (SQLite round() would give 0.5).
+        self.assertEqual(self._recalculated(0.125, [15]), (0.25, 0.25))
+        self.assertEqual(self._recalculated(0.375, []), (0.5, 0.5))
+        # 7.5 minutes is half a quarter -> even (0 quarters).
+        self.assertEqual(self._recalculated(0.0, [7.5]), (0.0, 0.0))
+        self.assertEqual(self._recalculated(0.0, [22.5]), (0.5, 0.5))
+
+    def test_matches_python_quantization(self):
+        for additional_hours in (0.0, 0.1, 0.2, 0.625, 1.125, 2.875):
+            for span_minutes in ([], [7.5], [15, 37.5], [52.5, 1, 8]):
+                with self.subTest(additional_hours=additional_hours, spans=span_minutes):
+                    got, expected = self._recalculated(additional_hours, span_minutes)
+                    self.assertEqual(got, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+import db
+from models import Category, LogEntry, Timer
+
+# log_entries/timers as created before category codes and entry uuids.
+_BASELINE = [
+    "CREATE TABLE projects (id INTEGER NOT NULL PRIMARY KEY, name VARCHAR NOT NULL UNIQUE)",
+    """
+    CREATE TABLE log_entries (
+        id INTEGER NOT NULL PRIMARY KEY,
+        date DATE NOT NULL,
+        category VARCHAR(7) NOT NULL,
+        project_id INTEGER NOT NULL REFERENCES projects (id),
+        task TEXT NOT NULL,
+        hours FLOAT NOT NULL,
+        additional_hours FLOAT NOT NULL,
+        status VARCHAR(50),
+        notes TEXT
+    )
+    """,
+    "CREATE INDEX ix_log_entries_date ON log_entries (date)",
+    """
+    CREATE TABLE timers (
+        id INTEGER NOT NULL PRIMARY KEY,
+        log_entry_id INTEGER REFERENCES log_entries (id),
+        started_at DATETIME NOT NULL,
+        status VARCHAR(7) NOT NULL,
+        date DATE,
+        category VARCHAR(7),
+        project_id INTEGER REFERENCES projects (id),
+        task TEXT
+    )
+    """,
+    "INSERT INTO projects (id, name) VALUES (1, 'P')",
+    "INSERT INTO log_entries (id, date, category, project_id, task, hours, additional_hours)"
+    " VALUES (1, '2026-01-02', 'OKR', 1, 'a', 1.0, 0.0),"
+    " (2, '2026-01-02', 'COMPANY', 1, 'b', 2.0, 0.0)",
+    "INSERT INTO timers (id, log_entry_id, started_at, status, category)"
+    " VALUES (1, 1, '2026-01-02 09:00:00', 'RUNNING', 'ROUTINE')",
+]
+
+
+class TestCategoryCodeUpgrade(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.tmpdir.name, 'w.db')}")
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.tmpdir.cleanup()
+
+    def _build(self, statements):
+        with self.engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+
+    def _columns(self, table):
+        with self.engine.connect() as conn:
+            rows = conn.execute(text(f"PRAGMA table_info({table})")).mappings().all()
+        return {r["name"]: (r["type"].upper(), r["notnull"]) for r in rows}
+
+    def _indexes(self, table):
+        with self.engine.connect() as conn:
+            rows = conn.execute(text(f"PRAGMA index_list({table})")).mappings().all()
+        return {r["name"] for r in rows}
+
+    def _assert_upgraded(self):
+        self.assertEqual(self._columns("log_entries")["category"], ("SMALLINT", 1))
+        self.assertEqual(self._columns("log_entries")["uuid"], ("VARCHAR(36)", 1))
+        self.assertEqual(self._columns("timers")["category"], ("SMALLINT", 0))
+        indexes = self._indexes("log_entries")
+        self.assertLessEqual({"ix_log_entries_date_category", "ix_log_entries_uuid"}, indexes)
+        self.assertNotIn("ix_log_entries_date", indexes)
+        with self.engine.connect() as conn:
+            raw = conn.execute(
+                text("SELECT id, category, typeof(category) FROM log_entries ORDER BY id")
+            ).all()
+        self.assertEqual(raw, [(1, 2, "integer"), (2, 4, "integer")])
+        with Session(self.engine) as session:
+            entries = session.query(LogEntry).order_by(LogEntry.id).all()
+            self.assertEqual([e.category for e in entries], [Category.OKR, Category.COMPANY])
+            self.assertTrue(all(e.uuid for e in entries))
+            self.assertEqual(session.get(Timer, 1).category, Category.ROUTINE)
+
+    def test_baseline_database_is_rebuilt_with_smallint_codes(self):
+        self._build(_BASELINE)
+        db.ensure_schema(self.engine)
+        self._assert_upgraded()
+
+    def test_codes_left_as_text_by_an_in_place_upgrade_are_converted(self):
+        self._build(_BASELINE)
+        with self.engine.begin() as conn:
+            conn.execute(text("UPDATE log_entries SET category = CASE id WHEN 1 THEN '2' ELSE '4' END"))
+            conn.execute(text("UPDATE timers SET category = '1'"))
+            conn.execute(text("PRAGMA user_version = 2"))
+        db.ensure_schema(self.engine)
+        self._assert_upgraded()
+
+    def test_nullable_code_column_from_an_alter_table_upgrade_is_rebuilt(self):
+        self._build(_BASELINE)
+        with self.engine.begin() as conn:
+            for table in ("log_entries", "timers"):
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN category_code SMALLINT"))
+                conn.execute(
+                    text(
+                        f"UPDATE {table} SET category_code = CASE category "
+                        "WHEN 'ROUTINE' THEN 1 WHEN 'OKR' THEN 2 WHEN 'COMPANY' THEN 4 END"
+                    )
+                )
+                conn.execute(text(f"ALTER TABLE {table} DROP COLUMN category"))
+                conn.execute(text(f"ALTER TABLE {table} RENAME COLUMN category_code TO category"))
+            conn.execute(text("PRAGMA user_version = 2"))
+        self.assertEqual(self._columns("log_entries")["category"], ("SMALLINT", 0))
+        db.ensure_schema(self.engine)
+        self._assert_upgraded()
+
+    def test_redundant_date_index_is_dropped_from_stamped_databases(self):
+        self._build(_BASELINE)
+        db.ensure_schema(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE INDEX ix_log_entries_date ON log_entries (date)"))
+            conn.execute(text("PRAGMA user_version = 3"))
+        db.ensure_schema(self.engine)
+        self._assert_upgraded()
+
+    def test_upgrade_is_idempotent(self):
+        self._build(_BASELINE)
+        db.ensure_schema(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text("PRAGMA user_version = 0"))
+        db.ensure_schema(self.engine)
+        self._assert_upgraded()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -122,6 +122,24 @@ class TestTimeMergePlanner(unittest.TestCase):
         self.assertEqual(len(plans), 2)
         self.assertEqual({p.merged_start for p in plans}, {t0, b0})
 
+    def test_assume_sorted_matches_sorting_for_ordered_input(self):
+        t0 = datetime(2026, 1, 1, 10, 0, 0)
+        spans = [
+            SpanLike(id=5, start_timestamp=t0, end_timestamp=t0 + timedelta(minutes=30)),
+            SpanLike(id=2, start_timestamp=t0 + timedelta(minutes=20), end_timestamp=None),
+            SpanLike(
+                id=3,
+                start_timestamp=t0 + timedelta(hours=3),
+                end_timestamp=t0 + timedelta(hours=4),
+            ),
+        ]
+        now = t0 + timedelta(hours=1)
+
+        self.assertEqual(
+            plan_connectable_timespan_merges(spans, reference_now=now, assume_sorted=True),
+            plan_connectable_timespan_merges(spans, reference_now=now),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
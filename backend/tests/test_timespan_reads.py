@@ -0,0 +1,58 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import crud
+from db import Base
+from models import Category, LogEntry, Project, TimeSpan
+
+
+class TestTimespanReads(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=self.engine)
+        self.db = sessionmaker(bind=self.engine, autoflush=False)()
+
+        project = Project(name="P")
+        entry = LogEntry(
+            date=date(2026, 1, 1),
+            category=Category.OKR,
+            project_rel=project,
+            task="t",
+            hours=0.0,
+        )
+        t0 = datetime(2026, 1, 1, 9, 0, 0)
+        # Touching spans: connectable, but reads must not merge them.
+        entry.timespans = [
+            TimeSpan(start_timestamp=t0, end_timestamp=t0 + timedelta(hours=1)),
+            TimeSpan(
+                start_timestamp=t0 + timedelta(hours=1),
+                end_timestamp=t0 + timedelta(hours=2),
+            ),
+        ]
+        self.db.add(entry)
+        self.db.commit()
+        self.entry_id = entry.id
+
+        self.statements: list[str] = []
+        event.listen(self.engine, "before_cursor_execute", self._count)
+
+    def tearDown(self):
+        event.remove(self.engine, "before_cursor_execute", self._count)
+        self.db.close()
+        self.engine.dispose()
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def test_get_timespans_for_entry_is_a_single_select(self):
+        spans = crud.get_timespans_for_entry(self.db, self.entry_id)
+        self.assertEqual(len(spans), 2)
+        self.assertEqual(len(self.statements), 1)
+        self.assertTrue(self.statements[0].lstrip().upper().startswith("SELECT"))
+
+
+if __name__ == "__main__":
+    unittest.main()
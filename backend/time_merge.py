@@ -1,25 +1,31 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Iterable, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, NamedTuple, Sequence
 
 DEFAULT_GAP_MINUTES = 15
 MIN_DURATION_MINUTES = 15
 
 
-@dataclass(frozen=True, slots=True)
-class SpanLike:
-    """Minimal span shape needed for merge planning."""
+class SpanLike(NamedTuple):
+    """Minimal span shape needed for merge planning.
+
+    A NamedTuple so planner input can be built straight from (id, start, end)
+    result rows without a per-span __init__.
+    """
 
     id: int
     start_timestamp: datetime
     end_timestamp: datetime | None
 
 
-@dataclass(frozen=True, slots=True)
-class MergePlan:
-    """Instructions to merge a connectable group of spans."""
+class MergePlan(NamedTuple):
+    """Instructions to merge a connectable group of spans.
+
+    A NamedTuple rather than a frozen dataclass: construction is a single
+    tuple allocation instead of per-field object.__setattr__ calls.
+    """
 
     keeper_id: int
     merged_start: datetime
@@ -27,11 +33,80 @@ class MergePlan:
     delete_ids: tuple[int, ...]
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(slots=True)
+class _GroupAcc:
+    """Running aggregates for one connectable group during the sweep."""
+
+    merged_start: datetime
+    closed_end: datetime | None
+    any_open: bool
+    min_id: int
+    max_open_id: int | None
+    has_preferred: bool
+    ids: list[int]
+
+    @classmethod
+    def start(cls, span: SpanLike, prefer_timespan_id: int | None) -> _GroupAcc:
+        is_open = span.end_timestamp is None
+        return cls(
+            merged_start=span.start_timestamp,
+            closed_end=span.end_timestamp,
+            any_open=is_open,
+            min_id=span.id,
+            max_open_id=span.id if is_open else None,
+            has_preferred=span.id == prefer_timespan_id,
+            ids=[span.id],
+        )
+
+    def add(self, span: SpanLike, prefer_timespan_id: int | None) -> None:
+        span_id = span.id
+        self.ids.append(span_id)
+        if span_id < self.min_id:
+            self.min_id = span_id
+        if span_id == prefer_timespan_id:
+            self.has_preferred = True
+        end = span.end_timestamp
+        if end is None:
+            self.any_open = True
+            if self.max_open_id is None or span_id > self.max_open_id:
+                self.max_open_id = span_id
+        elif self.closed_end is None or end > self.closed_end:
+            self.closed_end = end
+
+    def to_plan(self, prefer_timespan_id: int | None) -> MergePlan:
+        if self.has_preferred:
+            keeper_id = prefer_timespan_id
+        elif self.max_open_id is not None:
+            # If there's an open/running span in the group, keep it as the
+            # "keeper" so callers can continue referencing the active row.
+            keeper_id = self.max_open_id
+        else:
+            keeper_id = self.min_id
+
+        merged_start = self.merged_start
+        if self.any_open:
+            merged_end: datetime | None = None
+        else:
+            merged_end = self.closed_end
+            if merged_end <= merged_start:
+                merged_end = merged_start + timedelta(minutes=MIN_DURATION_MINUTES)
+
+        self.ids.remove(keeper_id)
+        self.ids.sort()
+        # Positional: NamedTuple keyword construction costs ~2x.
+        return MergePlan(keeper_id, merged_start, merged_end, tuple(self.ids))
+
+
 def plan_connectable_timespan_merges(
     spans: Sequence[SpanLike] | Iterable[SpanLike],
     gap_minutes: int = DEFAULT_GAP_MINUTES,
     prefer_timespan_id: int | None = None,
     reference_now: datetime | None = None,
+    assume_sorted: bool = False,
 ) -> list[MergePlan]:
     """Plan merges for connectable spans using the same rules as backend CRUD.
 
@@ -41,80 +116,98 @@ def plan_connectable_timespan_merges(
     - Small gaps up to gap_minutes included
 
     Open/running spans (end is None) are treated as end=reference_now for
-    connectability checks (default: current UTC time). This prevents open spans
-    from absorbing future spans. If any span in a group is open, the merged
-    result is also open (merged_end=None).
+    connectability checks (default: current UTC time, read only if an open
+    span is present). This prevents open spans from absorbing future spans.
+    If any span in a group is open, the merged result is also open
+    (merged_end=None).
+
+    Pass assume_sorted=True when spans already come ordered by
+    (start_timestamp, id), e.g. straight from the DB query, to skip the sort.
     """
-    spans_list = list(spans)
+    # Sorting happens in place, so only copy when we sort (or when given a
+    # one-shot iterable); pre-ordered sequences are swept as passed.
+    if assume_sorted and isinstance(spans, Sequence):
+        spans_list = spans
+    else:
+        spans_list = list(spans)
     if len(spans_list) <= 1:
         return []
-
-    if reference_now is None:
-        reference_now = datetime.utcnow()
+    if len(spans_list) == 2:
+        return _plan_pair(
+            spans_list, gap_minutes, prefer_timespan_id, reference_now, assume_sorted
+        )
 
     # Match DB ordering used by merge_connectable_timespans_for_entry():
     # order_by(start_timestamp asc, id asc)
-    spans_list.sort(key=lambda s: (s.start_timestamp, s.id))
+    if not assume_sorted:
+        spans_list.sort(key=lambda s: (s.start_timestamp, s.id))
 
     gap = timedelta(minutes=gap_minutes)
 
-    def effective_end(span: SpanLike) -> datetime:
-        # Treat open span as current time for connectability checks.
-        if span.end_timestamp is None:
-            return max(reference_now, span.start_timestamp)
-        return span.end_timestamp
-
-    groups: list[list[SpanLike]] = []
-    current_group: list[SpanLike] = [spans_list[0]]
-    current_end = effective_end(spans_list[0])
-
-    for span in spans_list[1:]:
-        if span.start_timestamp <= current_end + gap:
-            current_group.append(span)
-            current_end = max(current_end, effective_end(span))
-        else:
-            groups.append(current_group)
-            current_group = [span]
-            current_end = effective_end(span)
-    groups.append(current_group)
-
+    # Single sweep: spans are sorted by start, so each group's merged_start
+    # is its first span's start and the rest is running aggregates.
+    # Open/running spans count as ending at reference_now (but never before
+    # their own start) for connectability; this is inlined rather than a
+    # helper because it runs for every span. The clock is only read once an
+    # open span is actually seen.
     plans: list[MergePlan] = []
-    for group in groups:
-        if len(group) == 1:
-            continue
-
-        keeper: SpanLike | None = None
-        if prefer_timespan_id is not None:
-            keeper = next((s for s in group if s.id == prefer_timespan_id), None)
-        if keeper is None:
-            # If there's an open/running span in the group, keep it as the
-            # "keeper" so callers can continue referencing the active row.
-            open_spans = [s for s in group if s.end_timestamp is None]
-            if open_spans:
-                keeper = max(open_spans, key=lambda s: s.id)
-            else:
-                keeper = min(group, key=lambda s: s.id)
+    span_iter = iter(spans_list)
+    first = next(span_iter)
+    group = _GroupAcc.start(first, prefer_timespan_id)
+    current_end = first.end_timestamp
+    if current_end is None:
+        if reference_now is None:
+            reference_now = _utcnow()
+        current_end = max(reference_now, first.start_timestamp)
+    # current_end + gap, recomputed only when current_end moves rather than
+    # building a new datetime for every span.
+    connect_until = current_end + gap
+
+    for span in span_iter:
+        start = span.start_timestamp
+        end = span.end_timestamp
+        if end is None:
+            if reference_now is None:
+                reference_now = _utcnow()
+            end = reference_now if reference_now > start else start
+        if start <= connect_until:
+            group.add(span, prefer_timespan_id)
+            if end > current_end:
+                current_end = end
+                connect_until = end + gap
+        else:
+            if len(group.ids) > 1:
+                plans.append(group.to_plan(prefer_timespan_id))
+            group = _GroupAcc.start(span, prefer_timespan_id)
+            current_end = end
+            connect_until = end + gap
+    if len(group.ids) > 1:
+        plans.append(group.to_plan(prefer_timespan_id))
 
-        merged_start = min(s.start_timestamp for s in group)
+    return plans
 
-        any_open = any(s.end_timestamp is None for s in group)
-        if any_open:
-            merged_end: datetime | None = None
-        else:
-            merged_end = max(
-                s.end_timestamp for s in group if s.end_timestamp is not None
-            )
-            if merged_end <= merged_start:
-                merged_end = merged_start + timedelta(minutes=MIN_DURATION_MINUTES)
 
-        delete_ids = tuple(sorted((s.id for s in group if s.id != keeper.id)))
-        plans.append(
-            MergePlan(
-                keeper_id=keeper.id,
-                merged_start=merged_start,
-                merged_end=merged_end,
-                delete_ids=delete_ids,
-            )
-        )
+def _plan_pair(
+    spans: Sequence[SpanLike],
+    gap_minutes: int,
+    prefer_timespan_id: int | None,
+    reference_now: datetime | None,
+    assume_sorted: bool,
+) -> list[MergePlan]:
+    """Two-span case of plan_connectable_timespan_merges (the common one).
 
-    return plans
+    Same rules, minus the sort and the sweep loop.
+    """
+    a, b = spans
+    if not assume_sorted and (b.start_timestamp, b.id) < (a.start_timestamp, a.id):
+        a, b = b, a
+    a_end = a.end_timestamp
+    if a_end is None:
+        if reference_now is None:
+            reference_now = _utcnow()
+        a_end = max(reference_now, a.start_timestamp)
+    if b.start_timestamp > a_end + timedelta(minutes=gap_minutes):
+        return []
+    group = _GroupAcc.start(a, prefer_timespan_id)
+    group.add(b, prefer_timespan_id)
+    return [group.to_plan(prefer_timespan_id)]